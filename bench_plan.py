@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Execution Plan Benchmark for LLM-BDD System
+Compares cold plan building (parse, compile, save) with warm loading of the cached plan
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from py313_tester import CompleteRealTester, SAMPLE_GHERKIN
+from execution_plan import PlanCache, compile_plan
+
+def large_feature(copies):
+    """SAMPLE_GHERKIN with its scenarios repeated under numbered names"""
+    header, _, body = SAMPLE_GHERKIN.partition("\n\n")
+    blocks = [re.sub(r'(Scenario(?: Outline)?:[^\n]*)', rf'\1 #{n}', body) for n in range(copies)]
+    return header + "\n\n" + "\n\n".join(blocks)
+
+def best_of(repeats, func):
+    """Fastest of several runs, in milliseconds"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold vs warm execution plan loading")
+    parser.add_argument("--copies", type=int, default=200,
+                        help="how many times to repeat the sample scenarios")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    feature = large_feature(args.copies)
+    tester = CompleteRealTester()
+    tester.generated_gherkin = feature
+    cache = PlanCache(tempfile.mkdtemp(prefix="plan_bench_"))
+
+    def cold():
+        scenarios = tester._parse_gherkin()
+        approved = [s for s in scenarios if s['type'] == 'positive']
+        cache.save(compile_plan(feature, scenarios, approved))
+
+    def warm():
+        return cache.load(feature)
+
+    cold_ms = best_of(args.repeats, cold)
+    warm_ms = best_of(args.repeats, warm)
+    plan = warm()
+    size_kb = os.path.getsize(cache.path(plan['key'])) / 1024
+
+    print(f"📄 Feature: {len(feature.splitlines())} lines, "
+          f"{len(plan['all_scenarios'])} scenarios, {len(plan['scenarios'])} approved")
+    print(f"💾 Plan file: {size_kb:.1f} KB")
+    print(f"🥶 Cold (parse + compile + save): {cold_ms:8.2f} ms")
+    print(f"🔥 Warm (load cached plan):       {warm_ms:8.2f} ms")
+    print(f"⚡ Speedup: {cold_ms / warm_ms:.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
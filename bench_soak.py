@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Soak Benchmark for LLM-BDD System
+Runs thousands of scenarios against the local stand-in site and checks memory stays flat
+"""
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from py313_tester import CompleteRealTester, SAMPLE_GHERKIN
+from soak import SoakRunner
+from standin_site import StandInSite, StandInDriver
+
+FLAT_THRESHOLD_MB = 5.0
+
+def headless_chrome():
+    from selenium import webdriver
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    return webdriver.Chrome(options=options)
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak memory benchmark")
+    parser.add_argument("--scenarios", type=int, default=10000)
+    parser.add_argument("--recycle-every", type=int, default=200)
+    parser.add_argument("--chrome", action="store_true",
+                        help="use headless Chrome instead of the HTTP stand-in driver")
+    args = parser.parse_args()
+
+    site = StandInSite()
+    workdir = tempfile.mkdtemp(prefix="soak_bench_")
+    os.chdir(workdir)
+    print(f"🌐 Stand-in site: {site.url}")
+    print(f"📁 Artifacts: {workdir}")
+
+    tester = CompleteRealTester()
+    tester.website_url = site.url
+    tester.driver_factory = headless_chrome if args.chrome else StandInDriver
+    tester.wait_scale = 0
+    tester.generated_gherkin = SAMPLE_GHERKIN
+    tester.scenarios = tester._parse_gherkin()
+    tester.approved = [s for s in tester.scenarios if s['type'] == 'positive']
+
+    runner = SoakRunner(tester, args.scenarios, args.recycle_every,
+                        sample_every=max(args.scenarios // 20, 1))
+    print(f"🧪 Running {args.scenarios} scenarios...")
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        report = runner.run()
+        tester.cleanup()
+    site.stop()
+
+    print(f"\n{'Scenarios':>10} {'RSS (MB)':>10} {'Browser (MB)':>13} {'Recycles':>9}")
+    for sample in report['memory_samples']:
+        browser = sample['browser_mb'] if sample['browser_mb'] is not None else "-"
+        print(f"{sample['scenarios']:>10} {sample['rss_mb']:>10} {browser:>13} {sample['recycles']:>9}")
+
+    # Compare the second quarter (after warm-up) with the last quarter
+    rss = [s['rss_mb'] for s in report['memory_samples'] if s['rss_mb'] is not None]
+    quarter = max(len(rss) // 4, 1)
+    warm = sum(rss[quarter:2 * quarter]) / len(rss[quarter:2 * quarter])
+    late = sum(rss[-quarter:]) / quarter
+    growth = late - warm
+    print(f"\n📊 Executed {report['executed']} ({report['passed']} passed), {report['recycles']} recycles")
+    print(f"📈 RSS growth after warm-up: {growth:+.1f} MB")
+    print("✅ FLAT" if growth < FLAT_THRESHOLD_MB else "❌ GROWING")
+    return 0 if growth < FLAT_THRESHOLD_MB else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
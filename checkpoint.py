@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Pipeline Checkpoint for LLM-BDD System
+Saves pipeline state after each stage so interrupted runs can resume
+"""
+import json
+import os
+from datetime import datetime
+
+CHECKPOINT_FILE = "pipeline_checkpoint.json"
+
+class PipelineCheckpoint:
+    def __init__(self, filename=CHECKPOINT_FILE):
+        self.filename = filename
+        self.state = {
+            "completed_stages": [],
+            "results": []
+        }
+
+    def exists(self):
+        """Check if a checkpoint was left by a previous run"""
+        return os.path.exists(self.filename)
+
+    def load(self):
+        """Load checkpoint state from disk"""
+        with open(self.filename, 'r', encoding='utf-8') as f:
+            self.state = json.load(f)
+        self.state.setdefault("completed_stages", [])
+        self.state.setdefault("results", [])
+        return self.state
+
+    def is_done(self, stage):
+        """Check if a pipeline stage already finished"""
+        return stage in self.state["completed_stages"]
+
+    def save_stage(self, stage, **fields):
+        """Record a finished stage together with its outputs"""
+        self.state.update(fields)
+        if stage not in self.state["completed_stages"]:
+            self.state["completed_stages"].append(stage)
+        self._write()
+
+    def save_result(self, result, reports=None):
+        """Record a finished scenario result"""
+        self.state["results"].append(result)
+        if reports is not None:
+            self.state["reports"] = list(reports)
+        self._write()
+
+    def finished_ids(self):
+        """Ids of scenarios that already have a result"""
+        return {r['id'] for r in self.state["results"]}
+
+    def clear(self):
+        """Remove the checkpoint after a complete run"""
+        if self.exists():
+            os.remove(self.filename)
+
+    def _write(self):
+        """Write state atomically so a crash never leaves a half-written file"""
+        self.state["updated"] = datetime.now().isoformat()
+        tmp = f"{self.filename}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp, self.filename)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Execution Plans for LLM-BDD System
+Compiles approved scenarios once (step bindings, parameters, locators, waits)
+and caches the plan in a compact binary file keyed by the feature text
+"""
+import hashlib
+import marshal
+import os
+import re
+import sys
+from datetime import datetime
+
+from locators import ELEMENTS
+
+PLAN_DIR = "plans"
+STEP_DEFINITIONS_VERSION = "2"
+STEP_KEYWORDS = ('Given', 'When', 'Then', 'And', 'But')
+
+# (pattern, action, elements used, wait) - first match wins
+STEP_DEFINITIONS = [
+    (r'I am on the login page', "open_login", [], ("page_load", 2)),
+    (r'I am logged in(?: as "(?P<username>[^"]*)")?', "login",
+     [("login", "username"), ("login", "password"), ("login", "login_button")], ("login", 2)),
+    (r'I enter "(?P<username>[^"]*)" as username', "type_username", [("login", "username")], None),
+    (r'I enter "(?P<password>[^"]*)" as password', "type_password", [("login", "password")], None),
+    (r'I click the login button', "click_login", [("login", "login_button")], ("login", 2)),
+    (r'I add "(?P<product>[^"]*)" to cart', "add_to_cart",
+     [("inventory", "add_to_cart_backpack")], ("add_to_cart", 1)),
+    (r'I click "Add to Cart" on "(?P<product>[^"]*)"', "add_to_cart",
+     [("inventory", "add_to_cart_backpack")], ("add_to_cart", 1)),
+    (r'the cart should show (?P<count>\d+) items?', "assert_cart_count",
+     [("inventory", "cart_badge")], None),
+    (r'I should be redirected to the products page', "assert_products_page", [], None),
+]
+_COMPILED_DEFINITIONS = [(re.compile(p, re.IGNORECASE), a, e, w) for p, a, e, w in STEP_DEFINITIONS]
+
+def plan_key(feature_text):
+    """Hash of the feature text, step definitions, locator table and Python version"""
+    digest = hashlib.sha256()
+    digest.update(feature_text.strip().encode('utf-8'))
+    digest.update(STEP_DEFINITIONS_VERSION.encode('utf-8'))
+    digest.update(repr(STEP_DEFINITIONS).encode('utf-8'))
+    digest.update(repr(sorted(ELEMENTS.items())).encode('utf-8'))
+    digest.update(sys.implementation.cache_tag.encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+def bind_step(step):
+    """Resolve one Gherkin step to an action with extracted parameters"""
+    text = step
+    for keyword in STEP_KEYWORDS:
+        if text.startswith(keyword + ' '):
+            text = text[len(keyword) + 1:]
+            break
+    for pattern, action, elements, wait in _COMPILED_DEFINITIONS:
+        match = pattern.search(text)
+        if match:
+            params = {k: v for k, v in match.groupdict().items() if v is not None}
+            return {"step": step, "action": action, "params": params,
+                    "elements": [f"{page}:{name}" for page, name in elements],
+                    "wait": list(wait) if wait else None}
+    return {"step": step, "action": "unbound", "params": {}, "elements": [], "wait": None}
+
+def compile_scenario(scenario):
+    """Approved scenario -> executable plan entry (a superset of the scenario dict)"""
+    bindings = [bind_step(step) for step in scenario['steps']]
+    compiled = dict(scenario)
+    compiled.update({
+        "bindings": bindings,
+        "unbound_steps": sum(1 for b in bindings if b['action'] == 'unbound')
+    })
+    return compiled
+
+def compile_plan(feature_text, scenarios, approved):
+    """Compile approved scenarios and the ranked locators of the elements they use"""
+    compiled = [compile_scenario(s) for s in approved]
+    needed = sorted({e for s in compiled for b in s['bindings'] for e in b['elements']})
+    locators = {}
+    for key in needed:
+        page, name = key.split(':')
+        locators[key] = [list(candidate) for candidate in ELEMENTS[(page, name)]]
+    return {
+        "key": plan_key(feature_text),
+        "compiled": datetime.now().isoformat(),
+        "step_definitions_version": STEP_DEFINITIONS_VERSION,
+        "all_scenarios": [{'name': s['name'], 'tags': s['tags'], 'type': s['type']} for s in scenarios],
+        "scenarios": compiled,
+        "locators": locators
+    }
+
+class PlanCache:
+    def __init__(self, directory=PLAN_DIR):
+        self.directory = directory
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.plan")
+
+    def load(self, feature_text):
+        """Load a compiled plan for this feature text, or None"""
+        path = self.path(plan_key(feature_text))
+        if not os.path.exists(path):
+            return None
+        try:
+            # One read then loads(): marshal.load() on a file reads in small chunks
+            with open(path, 'rb') as f:
+                return marshal.loads(f.read())
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def save(self, plan):
+        """Write the plan in marshal's compact binary format"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(plan['key'])
+        tmp = f"{path}.tmp"
+        with open(tmp, 'wb') as f:
+            marshal.dump(plan, f)
+        os.replace(tmp, path)
+        return path
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Run History Analysis for LLM-BDD System
+Loads past reports into columnar arrays and flags duration regressions
+"""
+import argparse
+import glob
+import json
+import os
+import re
+from datetime import datetime
+
+import numpy as np
+
+INDEX_FILE = "history_index.npz"
+REPORT_PATTERNS = ["complete_report_*.json", "llm_bdd_complete_report_*.json"]
+MIN_HISTORY = 5
+Z_THRESHOLD = 3.0
+OUTLINE_SUFFIX = re.compile(r' \[\d+/\d+ rows passed\]$')
+
+def _seconds(value):
+    """Parse '2.5s' style durations"""
+    try:
+        return float(str(value).rstrip('s'))
+    except ValueError:
+        return np.nan
+
+def _extract_run(report):
+    """Pull timestamp, results, LLM latency and stage timings from any report layout"""
+    stamp = report.get('timestamp') or report.get('date')
+    results = (report.get('test_execution', {}).get('results')
+               or report.get('execution', {}).get('test_results')
+               or report.get('test_results')
+               or [])
+    timings = report.get('timings', {})
+    return {
+        "time": datetime.fromisoformat(stamp).timestamp() if stamp else np.nan,
+        "results": [
+            (OUTLINE_SUFFIX.sub('', r['name']),
+             _seconds(r.get('time', r.get('execution_time', 'nan'))),
+             r['status'] == 'PASSED')
+            for r in results
+        ],
+        "llm_latency": timings.get('llm_latency_seconds', np.nan),
+        "stages": timings.get('stages', {})
+    }
+
+class RunHistory:
+    def __init__(self, directory=".", index_file=INDEX_FILE):
+        self.directory = directory
+        self.index_path = os.path.join(directory, index_file)
+        self.files = []
+        self.scenario_names = []
+        self.stage_names = []
+        # Per run
+        self.run_time = np.empty(0, dtype=np.float64)
+        self.run_llm_latency = np.empty(0, dtype=np.float64)
+        # Per scenario result
+        self.res_run = np.empty(0, dtype=np.int32)
+        self.res_scenario = np.empty(0, dtype=np.int32)
+        self.res_seconds = np.empty(0, dtype=np.float64)
+        self.res_passed = np.empty(0, dtype=bool)
+        # Per stage timing
+        self.stage_run = np.empty(0, dtype=np.int32)
+        self.stage_code = np.empty(0, dtype=np.int32)
+        self.stage_seconds = np.empty(0, dtype=np.float64)
+
+    def _load_index(self):
+        """Load the persisted columnar index if present"""
+        if not os.path.exists(self.index_path):
+            return
+        data = np.load(self.index_path, allow_pickle=False)
+        self.files = data['files'].tolist()
+        self.scenario_names = data['scenario_names'].tolist()
+        self.stage_names = data['stage_names'].tolist()
+        for name in ('run_time', 'run_llm_latency', 'res_run', 'res_scenario',
+                     'res_seconds', 'res_passed', 'stage_run', 'stage_code', 'stage_seconds'):
+            setattr(self, name, data[name])
+
+    def _save_index(self):
+        np.savez_compressed(
+            self.index_path,
+            files=np.array(self.files, dtype=str),
+            scenario_names=np.array(self.scenario_names, dtype=str),
+            stage_names=np.array(self.stage_names, dtype=str),
+            run_time=self.run_time, run_llm_latency=self.run_llm_latency,
+            res_run=self.res_run, res_scenario=self.res_scenario,
+            res_seconds=self.res_seconds, res_passed=self.res_passed,
+            stage_run=self.stage_run, stage_code=self.stage_code,
+            stage_seconds=self.stage_seconds
+        )
+
+    def load(self):
+        """Load the index, then append only reports not indexed yet"""
+        self._load_index()
+        known = set(self.files)
+        found = sorted({os.path.basename(p) for pattern in REPORT_PATTERNS
+                        for p in glob.glob(os.path.join(self.directory, pattern))})
+        new_files = [f for f in found if f not in known]
+        if not new_files:
+            return 0
+
+        scenario_codes = {name: i for i, name in enumerate(self.scenario_names)}
+        stage_codes = {name: i for i, name in enumerate(self.stage_names)}
+        run_time, llm = [], []
+        res_run, res_scenario, res_seconds, res_passed = [], [], [], []
+        stage_run, stage_code, stage_seconds = [], [], []
+
+        for filename in new_files:
+            try:
+                with open(os.path.join(self.directory, filename), 'r', encoding='utf-8') as f:
+                    run = _extract_run(json.load(f))
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"⚠️ Skipping {filename}: {e}")
+                continue
+            run_idx = len(self.files)
+            self.files.append(filename)
+            run_time.append(run['time'])
+            llm.append(run['llm_latency'])
+            for name, seconds, passed in run['results']:
+                code = scenario_codes.setdefault(name, len(scenario_codes))
+                res_run.append(run_idx)
+                res_scenario.append(code)
+                res_seconds.append(seconds)
+                res_passed.append(passed)
+            for stage, seconds in run['stages'].items():
+                stage_run.append(run_idx)
+                stage_code.append(stage_codes.setdefault(stage, len(stage_codes)))
+                stage_seconds.append(seconds)
+
+        self.scenario_names = list(scenario_codes)
+        self.stage_names = list(stage_codes)
+        self.run_time = np.concatenate([self.run_time, np.array(run_time, dtype=np.float64)])
+        self.run_llm_latency = np.concatenate([self.run_llm_latency, np.array(llm, dtype=np.float64)])
+        self.res_run = np.concatenate([self.res_run, np.array(res_run, dtype=np.int32)])
+        self.res_scenario = np.concatenate([self.res_scenario, np.array(res_scenario, dtype=np.int32)])
+        self.res_seconds = np.concatenate([self.res_seconds, np.array(res_seconds, dtype=np.float64)])
+        self.res_passed = np.concatenate([self.res_passed, np.array(res_passed, dtype=bool)])
+        self.stage_run = np.concatenate([self.stage_run, np.array(stage_run, dtype=np.int32)])
+        self.stage_code = np.concatenate([self.stage_code, np.array(stage_code, dtype=np.int32)])
+        self.stage_seconds = np.concatenate([self.stage_seconds, np.array(stage_seconds, dtype=np.float64)])
+        self._save_index()
+        return len(new_files)
+
+def _trend_per_day(times, values):
+    """Least-squares slope of values over time, in units per day"""
+    mask = ~np.isnan(times) & ~np.isnan(values)
+    if mask.sum() < 2 or np.ptp(times[mask]) == 0:
+        return None
+    slope = np.polyfit(times[mask] / 86400.0, values[mask], 1)[0]
+    return round(float(slope), 4)
+
+def _regression(run_ids, times, seconds):
+    """Compare the latest sample against the earlier distribution (robust z-score)"""
+    order = np.argsort(times[run_ids], kind='stable')
+    seconds = seconds[order]
+    seconds = seconds[~np.isnan(seconds)]
+    if len(seconds) < MIN_HISTORY + 1:
+        return None
+    history, latest = seconds[:-1], seconds[-1]
+    median = np.median(history)
+    mad = np.median(np.abs(history - median))
+    scale = max(1.4826 * mad, 0.05 * median, 1e-6)
+    z = (latest - median) / scale
+    return {
+        "latest": round(float(latest), 3),
+        "median": round(float(median), 3),
+        "p95": round(float(np.percentile(history, 95)), 3),
+        "z_score": round(float(z), 2),
+        "flagged": bool(abs(z) > Z_THRESHOLD and latest > np.percentile(history, 95))
+    }
+
+def analyze(history):
+    """Per-scenario percentiles, pass-rate and LLM latency trends, regression flags"""
+    runs = len(history.files)
+    run_total = np.bincount(history.res_run, minlength=runs)
+    run_passed = np.bincount(history.res_run, weights=history.res_passed, minlength=runs)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        pass_rate = np.where(run_total > 0, run_passed / run_total, np.nan)
+
+    scenarios = []
+    for code, name in enumerate(history.scenario_names):
+        mask = history.res_scenario == code
+        seconds = history.res_seconds[mask]
+        valid = seconds[~np.isnan(seconds)]
+        run_ids = history.res_run[mask]
+        entry = {
+            "name": name,
+            "runs": int(mask.sum()),
+            "pass_rate": round(float(history.res_passed[mask].mean()), 3),
+            "p50": round(float(np.percentile(valid, 50)), 3) if len(valid) else None,
+            "p95": round(float(np.percentile(valid, 95)), 3) if len(valid) else None,
+            "pass_rate_trend_per_day": _trend_per_day(history.run_time[run_ids],
+                                                      history.res_passed[mask].astype(np.float64)),
+            "regression": _regression(run_ids, history.run_time, history.res_seconds[mask])
+        }
+        scenarios.append(entry)
+
+    stages = []
+    for code, name in enumerate(history.stage_names):
+        mask = history.stage_code == code
+        run_ids = history.stage_run[mask]
+        seconds = history.stage_seconds[mask]
+        stages.append({
+            "stage": name,
+            "runs": int(mask.sum()),
+            "p50": round(float(np.percentile(seconds, 50)), 3),
+            "p95": round(float(np.percentile(seconds, 95)), 3),
+            "regression": _regression(run_ids, history.run_time, seconds)
+        })
+
+    flagged = [s['name'] for s in scenarios if s['regression'] and s['regression']['flagged']]
+    flagged += [f"stage:{s['stage']}" for s in stages if s['regression'] and s['regression']['flagged']]
+
+    return {
+        "generated": datetime.now().isoformat(),
+        "runs_analyzed": runs,
+        "pass_rate_trend_per_day": _trend_per_day(history.run_time, pass_rate),
+        "llm_latency_trend_per_day": _trend_per_day(history.run_time, history.run_llm_latency),
+        "scenarios": scenarios,
+        "stages": stages,
+        "flagged": flagged
+    }
+
+def html_section(analysis):
+    """HTML section for the pipeline report"""
+    html = f"""
+    <h2>Duration History ({analysis['runs_analyzed']} runs)</h2>
+    <p><strong>Pass-rate trend:</strong> {analysis['pass_rate_trend_per_day']} per day &nbsp;
+       <strong>LLM latency trend:</strong> {analysis['llm_latency_trend_per_day']} s per day</p>
+    <table border="1" cellpadding="5">
+        <tr><th>Scenario / Stage</th><th>Runs</th><th>p50 (s)</th><th>p95 (s)</th><th>Latest (s)</th><th>Regression</th></tr>
+"""
+    rows = [(s['name'], s) for s in analysis['scenarios']]
+    rows += [(f"stage: {s['stage']}", s) for s in analysis['stages']]
+    for label, s in rows:
+        reg = s['regression'] or {}
+        flag = "⚠️ YES" if reg.get('flagged') else "no"
+        style = ' style="background: #f8d7da;"' if reg.get('flagged') else ""
+        html += (f'        <tr{style}><td>{label}</td><td>{s["runs"]}</td><td>{s["p50"]}</td>'
+                 f'<td>{s["p95"]}</td><td>{reg.get("latest", "-")}</td><td>{flag}</td></tr>\n')
+    html += "    </table>\n"
+    return html
+
+def run_analysis(directory=".", output=None):
+    """Load history, analyze it and write the JSON result"""
+    history = RunHistory(directory)
+    added = history.load()
+    analysis = analyze(history)
+    output = output or os.path.join(directory, "history_analysis.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(analysis, f, indent=2)
+    print(f"📈 History: {analysis['runs_analyzed']} runs ({added} new), "
+          f"{len(analysis['flagged'])} regressions flagged")
+    return analysis, output
+
+def main():
+    parser = argparse.ArgumentParser(description="Duration regression analysis over run history")
+    parser.add_argument("--dir", default=".", help="directory containing past reports")
+    parser.add_argument("--output", help="where to write the JSON analysis")
+    args = parser.parse_args()
+
+    analysis, output = run_analysis(args.dir, args.output)
+    print(f"📁 Analysis saved: {output}")
+    for name in analysis['flagged']:
+        print(f"  ⚠️ Regression: {name}")
+
+if __name__ == "__main__":
+    main()
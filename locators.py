@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Self-Healing Locators for LLM-BDD System
+Ranked fallback strategies with a persisted cache of the locator that worked
+"""
+import json
+import os
+from datetime import datetime
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+LOCATOR_CACHE_FILE = "locator_cache.json"
+
+# Logical elements -> ranked candidates (primary first):
+# ID, data-test attribute, accessible name, visible text, CSS path.
+# A fallback must identify this element only: generic text or positional
+# fallbacks would pick another product (or its Remove button) instead.
+ELEMENTS = {
+    ("login", "username"): [
+        ("id", "user-name"),
+        ("data-test", "username"),
+        ("name", "Username"),
+        ("css", "form input[type='text']")
+    ],
+    ("login", "password"): [
+        ("id", "password"),
+        ("data-test", "password"),
+        ("name", "Password"),
+        ("css", "form input[type='password']")
+    ],
+    ("login", "login_button"): [
+        ("id", "login-button"),
+        ("data-test", "login-button"),
+        ("name", "Login"),
+        ("css", "form input[type='submit']")
+    ],
+    ("inventory", "add_to_cart_backpack"): [
+        ("id", "add-to-cart-sauce-labs-backpack"),
+        ("data-test", "add-to-cart-sauce-labs-backpack"),
+        ("xpath", '//*[contains(@class, "inventory_item")]'
+                  '[.//*[contains(@class, "inventory_item_name") and normalize-space()="Sauce Labs Backpack"]]'
+                  '//button[starts-with(@data-test, "add-to-cart")]')
+    ],
+    ("inventory", "cart_badge"): [
+        ("class", "shopping_cart_badge"),
+        ("data-test", "shopping-cart-badge"),
+        ("css", ".shopping_cart_link span")
+    ],
+}
+
+def to_selenium(strategy, value):
+    """Translate a ranked strategy into a Selenium (By, value) pair"""
+    if strategy == "id":
+        return By.ID, value
+    if strategy == "class":
+        return By.CLASS_NAME, value
+    if strategy == "data-test":
+        return By.CSS_SELECTOR, f'[data-test="{value}"]'
+    if strategy == "name":
+        return By.XPATH, f'//*[@aria-label="{value}" or @name="{value}" or @placeholder="{value}" or @value="{value}"]'
+    if strategy == "text":
+        return By.XPATH, f'//*[normalize-space(text())="{value}"]'
+    if strategy == "css":
+        return By.CSS_SELECTOR, value
+    if strategy == "xpath":
+        return By.XPATH, value
+    raise ValueError(f"Unknown locator strategy: {strategy}")
+
+class LocatorCache:
+    def __init__(self, filename=LOCATOR_CACHE_FILE):
+        self.filename = filename
+        self.entries = {}
+        if os.path.exists(filename):
+            with open(filename, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def get(self, page, element):
+        entry = self.entries.get(f"{page}:{element}")
+        return (entry['strategy'], entry['value']) if entry else None
+
+    def put(self, page, element, strategy, value):
+        self.entries[f"{page}:{element}"] = {
+            "strategy": strategy,
+            "value": value,
+            "updated": datetime.now().isoformat()
+        }
+        tmp = f"{self.filename}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp, self.filename)
+
+class SelfHealingLocator:
+    """Resolves logical elements, trying the cached winner before ranked fallbacks
+
+    Uses find_elements so a missing candidate returns immediately instead of
+    raising, and never waits out a lookup timeout.
+    """
+
+    def __init__(self, driver, cache, metrics, events):
+        self.driver = driver
+        self.cache = cache
+        self.metrics = metrics
+        self.events = events
+        self.heals = []
+        self.resolved = {}
+
+    def use_plan(self, locators):
+        """Take ranked candidates from a compiled execution plan instead of ELEMENTS"""
+        self.resolved = {key: [tuple(candidate) for candidate in candidates]
+                         for key, candidates in locators.items()}
+
+    def find(self, page, element):
+        """Find one element, healing to the first working fallback"""
+        candidates = self.resolved.get(f"{page}:{element}") or ELEMENTS[(page, element)]
+        cached = self.cache.get(page, element)
+        if cached not in candidates:
+            cached = None  # stale winner from an older locator table
+        if cached:
+            found = self.driver.find_elements(*to_selenium(*cached))
+            if self._unambiguous(found, cached, candidates[0]):
+                self.metrics.cache_hits.inc(cache="locator")
+                return found[0]
+
+        for strategy, value in candidates:
+            if (strategy, value) == cached:
+                continue
+            found = self.driver.find_elements(*to_selenium(strategy, value))
+            if not self._unambiguous(found, (strategy, value), candidates[0]):
+                continue
+            if cached or (strategy, value) != candidates[0]:
+                self._heal(page, element, cached or candidates[0], (strategy, value))
+            self.cache.put(page, element, strategy, value)
+            return found[0]
+
+        raise NoSuchElementException(f"No locator matched {page}:{element}")
+
+    def _unambiguous(self, found, locator, primary):
+        """Fallbacks must match exactly one element, or they could pick a different one"""
+        if locator == primary:
+            return bool(found)
+        return len(found) == 1
+
+    def _heal(self, page, element, broken, healed):
+        """Record that a locator stopped matching and a fallback took over"""
+        heal = {
+            "timestamp": datetime.now().isoformat(),
+            "page": page,
+            "element": element,
+            "broken": f"{broken[0]}={broken[1]}",
+            "healed": f"{healed[0]}={healed[1]}",
+            "url": self.driver.current_url
+        }
+        self.heals.append(heal)
+        self.metrics.locator_heals.inc(page=page, element=element)
+        self.events.emit("locator_healed", **heal)
+        print(f"  🩹 Healed {page}:{element}: {heal['broken']} -> {heal['healed']}")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Live Metrics for LLM-BDD System
+Prometheus text endpoint and JSON-lines event log for pipeline runs
+"""
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+def _label_text(labels):
+    """Format a label tuple as {k="v",...}"""
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{v}"' for k, v in labels)
+    return "{" + inner + "}"
+
+class Counter:
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self.lock:
+            for key, value in self.values.items():
+                lines.append(f"{self.name}{_label_text(key)} {value}")
+        return lines
+
+class Gauge(Counter):
+    def set(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            self.values[key] = value
+
+    def render(self):
+        lines = super().render()
+        lines[1] = f"# TYPE {self.name} gauge"
+        return lines
+
+class Histogram:
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self.series = {}
+        self.lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            counts, total, count = self.series.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self.series[key] = (counts, total + value, count + 1)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            for key, (counts, total, count) in self.series.items():
+                for bound, bucket_count in zip(self.buckets, counts):
+                    labels = key + (("le", bound),)
+                    lines.append(f"{self.name}_bucket{_label_text(labels)} {bucket_count}")
+                lines.append(f"{self.name}_bucket{_label_text(key + (('le', '+Inf'),))} {count}")
+                lines.append(f"{self.name}_sum{_label_text(key)} {total}")
+                lines.append(f"{self.name}_count{_label_text(key)} {count}")
+        return lines
+
+class PipelineMetrics:
+    def __init__(self):
+        self.llm_latency = Histogram("llmbdd_llm_request_seconds", "LLM request latency")
+        self.llm_tokens = Counter("llmbdd_llm_tokens_total", "LLM tokens used")
+        self.cache_hits = Counter("llmbdd_cache_hits_total", "Cache hits by cache")
+        self.scenarios = Counter("llmbdd_scenarios_total", "Scenarios by pipeline outcome")
+        self.step_duration = Histogram("llmbdd_step_seconds", "Pipeline step duration")
+        self.scenario_duration = Histogram("llmbdd_scenario_seconds", "Scenario execution duration")
+        self.waits = Histogram("llmbdd_wait_seconds", "Time spent in explicit waits",
+                               buckets=(0.5, 1, 2, 3, 5, 10))
+        self.drivers_in_use = Gauge("llmbdd_driver_pool_in_use", "Browser drivers currently busy")
+        self.driver_pool_size = Gauge("llmbdd_driver_pool_size", "Browser drivers open")
+        self.artifact_bytes = Counter("llmbdd_artifact_bytes_total", "Bytes written to artifacts")
+        self.locator_heals = Counter("llmbdd_locator_heals_total", "Locators healed by a fallback strategy")
+        self.stage_utilization = Gauge("llmbdd_stage_utilization", "Fraction of time a pipeline stage was busy")
+        self.queue_depth = Gauge("llmbdd_queue_depth", "Items waiting in a pipeline queue")
+        self.server = None
+
+    def all(self):
+        return [value for value in vars(self).values()
+                if isinstance(value, (Counter, Histogram))]
+
+    def render(self):
+        """Render every metric in Prometheus text format"""
+        lines = []
+        for metric in self.all():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def start_server(self, port, host="127.0.0.1"):
+        """Serve /metrics on a background thread"""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        print(f"📈 Metrics: http://{host}:{self.server.server_port}/metrics")
+        return self.server.server_port
+
+    def stop_server(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+class EventLog:
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.lock = threading.Lock()
+
+    def emit(self, event, **fields):
+        """Append one structured event as a JSON line"""
+        if not self.filename:
+            return
+        record = {"ts": datetime.now().isoformat(), "event": event}
+        record.update(fields)
+        with self.lock:
+            with open(self.filename, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + "\n")
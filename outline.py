@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Scenario Outline support for LLM-BDD System
+Lazily expands Examples tables (inline, CSV or JSONL) into concrete scenarios
+"""
+import csv
+import itertools
+import json
+import os
+import re
+
+PARAM_PATTERN = re.compile(r'<([^<>]+)>')
+SOURCE_PATTERN = re.compile(r'^(?:Examples|Scenarios):\s*"([^"]+\.(?:csv|jsonl))"\s*$')
+FAILED_ROWS_KEPT = 20
+
+def parse_examples_header(line):
+    """Start an Examples block: inline table or external CSV/JSONL source
+
+    External data is referenced by quoting the file name:
+        Examples: "data/users.csv"
+    """
+    match = SOURCE_PATTERN.match(line)
+    if match:
+        return {'source': match.group(1)}
+    return {'header': [], 'rows': []}
+
+def add_table_row(block, line):
+    """Add a '| a | b |' row to an inline Examples block"""
+    if 'source' in block:
+        return
+    cells = [cell.strip() for cell in line.strip().strip('|').split('|')]
+    if not block['header']:
+        block['header'] = cells
+    else:
+        block['rows'].append(cells)
+
+def _iter_source(path):
+    """Stream rows from a CSV or JSONL file one at a time"""
+    if path.endswith('.jsonl'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield {k: str(v) for k, v in json.loads(line).items()}
+    else:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                yield row
+
+def iter_examples(scenario):
+    """Yield each example row of an outline as a dict, without loading files"""
+    for block in scenario.get('examples', []):
+        if 'source' in block:
+            yield from _iter_source(block['source'])
+        else:
+            for cells in block['rows']:
+                yield dict(zip(block['header'], cells))
+
+def substitute(text, example):
+    """Replace <param> placeholders with example values"""
+    return PARAM_PATTERN.sub(lambda m: example.get(m.group(1), m.group(0)), text)
+
+def expand_outline(scenario, start=0):
+    """Generate one concrete scenario per example row, starting at row `start`"""
+    rows = itertools.islice(iter_examples(scenario), start, None)
+    for index, example in enumerate(rows, start + 1):
+        case = {
+            'name': substitute(scenario['name'], example),
+            'tags': scenario['tags'],
+            'type': scenario['type'],
+            'steps': [substitute(step, example) for step in scenario['steps']],
+            'example': example,
+            'example_index': index
+        }
+        # Compiled outlines reuse the template's step bindings
+        if 'bindings' in scenario:
+            case['bindings'] = [
+                dict(binding, step=substitute(binding['step'], example),
+                     params={k: substitute(v, example) for k, v in binding['params'].items()})
+                for binding in scenario['bindings']]
+        yield case
+
+def describe_examples(scenario):
+    """Short description of where an outline's examples come from"""
+    parts = []
+    for block in scenario.get('examples', []):
+        if 'source' in block:
+            parts.append(block['source'])
+        else:
+            parts.append(f"{len(block['rows'])} inline rows")
+    return ", ".join(parts) or "no examples"
+
+class OutlineRecorder:
+    """Append-only compact per-row results for one outline
+
+    Each row is one short JSON line ({"r": row, "s": "P"/"F", "t": seconds},
+    plus "u": number of skipped steps when a step had no step definition),
+    so results for huge example tables never accumulate in memory and a
+    resumed run can continue after the last recorded row.
+    """
+
+    def __init__(self, test_id, name, filename):
+        self.test_id = test_id
+        self.name = name
+        self.filename = filename
+        self.done = 0
+        self.passed = 0
+        self.failed_rows = []
+        self.failed = 0
+        self.skipped_rows = 0
+        self.seconds = 0.0
+        if os.path.exists(self.filename):
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        self._count(json.loads(line))
+        self.file = open(self.filename, 'a', encoding='utf-8')
+
+    def _count(self, row):
+        self.done += 1
+        self.seconds += row['t']
+        if row.get('u'):
+            self.skipped_rows += 1
+        if row['s'] == 'P':
+            self.passed += 1
+        else:
+            self.failed += 1
+            if len(self.failed_rows) < FAILED_ROWS_KEPT:
+                self.failed_rows.append(row['r'])
+
+    def record(self, index, result):
+        """Append one row result"""
+        row = {
+            "r": index,
+            "s": "P" if result['status'] == 'PASSED' else "F",
+            "t": float(result['time'].rstrip('s'))
+        }
+        if result.get('skipped_steps'):
+            row["u"] = len(result['skipped_steps'])
+        self.file.write(json.dumps(row, separators=(',', ':')) + "\n")
+        self.file.flush()
+        self._count(row)
+
+    def close(self):
+        self.file.close()
+
+    def summary(self, result_type):
+        """One compact result entry for the whole outline"""
+        return {
+            "id": self.test_id,
+            "name": f"{self.name} [{self.passed}/{self.done} rows passed]",
+            "status": "PASSED" if self.failed == 0 and self.done > 0 else "FAILED",
+            "time": f"{self.seconds:.1f}s",
+            "type": result_type,
+            "rows": {"total": self.done, "passed": self.passed, "failed": self.failed},
+            "failed_rows": self.failed_rows,
+            "rows_with_skipped_steps": self.skipped_rows,
+            "rows_file": self.filename
+        }
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Pipelined Batch Runner for LLM-BDD System
+generate -> parse/validate -> approve -> execute -> report, joined by bounded queues
+"""
+import queue
+import threading
+import time
+
+from locators import SelfHealingLocator
+
+STOP = object()
+
+class Stage(threading.Thread):
+    """One pipeline stage: takes jobs from inbox, puts them on outbox"""
+
+    def __init__(self, name, work, inbox, outbox, metrics):
+        super().__init__(name=f"stage-{name}", daemon=True)
+        self.stage = name
+        self.work = work
+        self.inbox = inbox
+        self.outbox = outbox
+        self.metrics = metrics
+        self.items = 0
+        self.busy = 0.0
+        self.blocked = 0.0
+        self.wall = 0.0
+
+    def run(self):
+        started = time.perf_counter()
+        while True:
+            job = self.inbox.get()
+            self.metrics.queue_depth.set(self.inbox.qsize(), queue=self.stage)
+            if job is STOP:
+                break
+
+            work_start = time.perf_counter()
+            try:
+                job = self.work(job)
+            except Exception as e:
+                print(f"❌ [{self.stage}] {e}")
+                job = None
+            self.busy += time.perf_counter() - work_start
+            self.items += 1
+            self._publish(started)
+
+            if job is not None and self.outbox is not None:
+                put_start = time.perf_counter()
+                self.outbox.put(job)
+                self.blocked += time.perf_counter() - put_start
+
+        if self.outbox is not None:
+            self.outbox.put(STOP)
+        self._publish(started)
+
+    def _publish(self, started):
+        self.wall = time.perf_counter() - started
+        self.metrics.stage_utilization.set(round(self.utilization(), 3), stage=self.stage)
+
+    def utilization(self):
+        return self.busy / self.wall if self.wall else 0.0
+
+class BatchPipeline:
+    """Runs many requirement sets so LLM generation overlaps browser execution
+
+    Queues are bounded, so a fast stage blocks (backpressure) instead of
+    piling up generated jobs in memory.
+    """
+
+    def __init__(self, host, requirement_sets, approve="positive", queue_size=2):
+        self.host = host
+        self.requirement_sets = requirement_sets
+        self.approve = approve
+        self.queue_size = queue_size
+        self.browser_ready = None
+        self.stages = []
+        self.jobs = []
+        self.jobs_done = []
+
+    def _new_job(self, number, requirements):
+        job = type(self.host)(name_suffix=f"_set{number}")
+        job.api_key = self.host.api_key
+        job.metrics = self.host.metrics
+        job.events = self.host.events
+        job.requirements = requirements
+        self.jobs.append(job)
+        return job
+
+    def _generate(self, job):
+        print(f"🤖 [generate] {job.requirements}")
+        try:
+            job.generated_gherkin = job._request_gherkin()
+        except Exception as e:
+            print(f"❌ [generate] AI Error: {e}")
+            job.events.emit("llm_error", error=str(e))
+            job.generated_gherkin = None
+        return job
+
+    def _parse(self, job):
+        if job.generated_gherkin is None:
+            job._use_sample_gherkin()
+        else:
+            job.scenarios = job._parse_gherkin()
+        empty = [s['name'] for s in job.scenarios if not s['steps']]
+        if empty:
+            print(f"⚠️ [parse] Dropping scenarios without steps: {', '.join(empty)}")
+            job.scenarios = [s for s in job.scenarios if s['steps']]
+        if not job.scenarios:
+            print(f"❌ [parse] No valid scenarios for: {job.requirements}")
+            return None
+        job._save_gherkin_file()
+        return job
+
+    def _approve(self, job):
+        if job.manual_approval(choice=self.approve) == 0:
+            return None
+        job._prepare_plan()
+        return job
+
+    def _execute(self, job):
+        if self.browser_ready is None:
+            try:
+                self.host._open_browser()
+                self.browser_ready = True
+            except Exception as e:
+                print(f"❌ [execute] Real testing failed: {e} - simulating")
+                self.browser_ready = False
+        if self.browser_ready:
+            job.driver = self.host.driver
+            # Own locator per set (its heals go in its own report), shared cache file
+            job.locators = SelfHealingLocator(job.driver, self.host.locators.cache,
+                                              job.metrics, job.events)
+            if job.plan:
+                job.locators.use_plan(job.plan['locators'])
+            try:
+                job._execute_approved()
+                return job
+            except Exception as e:
+                print(f"❌ [execute] Real testing failed: {e} - simulating")
+        job._execute_simulated_tests()
+        return job
+
+    def _report(self, job):
+        job.compare_screenshots()
+        job.generate_complete_report()
+        job.checkpoint.clear()
+        self.jobs_done.append(job)
+        return job
+
+    def run(self):
+        """Feed requirement sets through the stages and wait for them to drain"""
+        steps = [("generate", self._generate), ("parse", self._parse),
+                 ("approve", self._approve), ("execute", self._execute),
+                 ("report", self._report)]
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in steps]
+        for i, (name, work) in enumerate(steps):
+            outbox = queues[i + 1] if i + 1 < len(steps) else None
+            self.stages.append(Stage(name, work, queues[i], outbox, self.host.metrics))
+        for stage in self.stages:
+            stage.start()
+
+        for number, requirements in enumerate(self.requirement_sets, 1):
+            queues[0].put(self._new_job(number, requirements))
+        queues[0].put(STOP)
+
+        try:
+            for stage in self.stages:
+                while stage.is_alive():
+                    stage.join(timeout=0.5)
+        finally:
+            # Batch runs are not resumable, so also drop checkpoints of jobs that failed midway
+            for job in self.jobs:
+                job.checkpoint.clear()
+        return self.jobs_done
+
+    def utilization_table(self):
+        rows = [f"{'Stage':<10} {'Items':>6} {'Busy (s)':>9} {'Blocked (s)':>12} {'Util':>6}"]
+        for s in self.stages:
+            rows.append(f"{s.stage:<10} {s.items:>6} {s.busy:>9.1f} "
+                        f"{s.blocked:>12.1f} {s.utilization():>6.0%}")
+        return "\n".join(rows)
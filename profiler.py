@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Stage Profiler for LLM-BDD System
+Wraps pipeline stages with cProfile and tracemalloc
+"""
+import cProfile
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+TOP_ALLOCATIONS = 15
+MAX_STACK_DEPTH = 64
+MAX_STACK_NODES = 20000
+MIN_STACK_FRACTION = 0.001
+
+def _func_label(func):
+    """Readable name for a pstats function key"""
+    filename, line, name = func
+    if filename == '~':
+        return name
+    return f"{os.path.basename(filename)}:{line}:{name}"
+
+def collapsed_stacks(stats):
+    """Convert pstats call graph into collapsed stacks (weights in microseconds)
+
+    Only branches carrying at least MIN_STACK_FRACTION of the total time are
+    followed, and at most MAX_STACK_NODES nodes are visited, so the walk stays
+    bounded however many distinct call paths the graph has.
+    """
+    raw = stats.stats
+    callees = {}
+    for func, (cc, nc, tt, ct, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+    for edges in callees.values():
+        edges.sort(key=lambda edge: edge[1], reverse=True)
+
+    roots = [func for func, entry in raw.items() if not entry[4]]
+    min_weight = sum(raw[root][3] for root in roots) * MIN_STACK_FRACTION
+    labels = {func: _func_label(func) for func in raw}
+    lines = {}
+    budget = [MAX_STACK_NODES]
+
+    def walk(func, path, on_path, inclusive):
+        if inclusive < min_weight or budget[0] <= 0:
+            return
+        budget[0] -= 1
+        total = raw[func][3]
+        fraction = inclusive / total if total else 0
+        path = path + [labels[func]]
+        self_time = raw[func][2] * fraction
+        if self_time > 0:
+            key = ";".join(path)
+            lines[key] = lines.get(key, 0) + self_time
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        on_path.add(func)
+        for callee, edge_time in callees.get(func, []):
+            if callee not in on_path:
+                walk(callee, path, on_path, edge_time * fraction)
+        on_path.discard(func)
+
+    for root in sorted(roots, key=lambda root: raw[root][3], reverse=True):
+        walk(root, [], set(), raw[root][3])
+
+    return [f"{stack} {int(weight * 1e6)}" for stack, weight in lines.items()
+            if int(weight * 1e6) > 0]
+
+class StageProfiler:
+    def __init__(self, output_dir=None):
+        self.output_dir = output_dir or f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.stages = []
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    @contextmanager
+    def profile(self, stage):
+        """Profile CPU and memory of one pipeline stage"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        profiler = cProfile.Profile()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            cpu = time.process_time() - cpu_start
+            wall = time.perf_counter() - wall_start
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            self._write_stage(stage, profiler, before, after)
+            self.stages.append({
+                "stage": stage,
+                "cpu_seconds": round(cpu, 3),
+                "wall_seconds": round(wall, 3),
+                "peak_memory_kb": round(peak / 1024, 1),
+                "retained_memory_kb": round(current / 1024, 1)
+            })
+
+    def _write_stage(self, stage, profiler, before, after):
+        """Write .prof dump, collapsed stacks and top allocation sites"""
+        base = os.path.join(self.output_dir, stage)
+        profiler.dump_stats(f"{base}.prof")
+
+        stacks = collapsed_stacks(pstats.Stats(profiler))
+        with open(f"{base}.collapsed", 'w', encoding='utf-8') as f:
+            f.write("\n".join(stacks) + "\n")
+
+        # Filter the per-line statistics, not the (much larger) list of traces
+        diff = [entry for entry in after.compare_to(before, 'lineno')
+                if entry.traceback[0].filename != tracemalloc.__file__]
+        with open(f"{base}.alloc.txt", 'w', encoding='utf-8') as f:
+            f.write(f"Top {TOP_ALLOCATIONS} allocation sites for stage: {stage}\n")
+            for entry in diff[:TOP_ALLOCATIONS]:
+                f.write(f"{entry}\n")
+
+    def summary_table(self):
+        """Plain text table of CPU time and peak memory per stage"""
+        rows = [f"{'Stage':<12} {'CPU (s)':>9} {'Wall (s)':>9} {'Peak (KB)':>11}"]
+        for s in self.stages:
+            rows.append(f"{s['stage']:<12} {s['cpu_seconds']:>9.3f} "
+                        f"{s['wall_seconds']:>9.3f} {s['peak_memory_kb']:>11.1f}")
+        return "\n".join(rows)
+
+    def close(self):
+        """Stop tracing and write the overall summary"""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        path = os.path.join(self.output_dir, "summary.txt")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.summary_table() + "\n")
+        return path
@@ -4,21 +4,77 @@ COMPLETE REAL LLM-BDD Testing - Shows Gherkin, Counts, Results
 """
 import openai
 from selenium import webdriver
-from selenium.webdriver.common.by import By
+from selenium.common.exceptions import (InvalidSessionIdException, NoSuchWindowException,
+                                        WebDriverException)
+from urllib3.exceptions import MaxRetryError, ProtocolError
 import time
 import json
 import random
 from datetime import datetime
 import sys
 import os
+import argparse
+from contextlib import contextmanager
 
-print("=" * 80)
-print("🌐 COMPLETE REAL LLM-BDD TESTING SYSTEM")
-print("=" * 80)
+from checkpoint import PipelineCheckpoint
+from metrics import PipelineMetrics, EventLog
+from profiler import StageProfiler
+from pipeline import BatchPipeline
+from locators import LocatorCache, SelfHealingLocator
+from soak import SoakRunner
+from execution_plan import PlanCache, bind_step, compile_plan
+from outline import (parse_examples_header, add_table_row, expand_outline,
+                     describe_examples, OutlineRecorder)
+
+SAMPLE_GHERKIN = """Feature: E-commerce Shopping
+  As a customer
+  I want to purchase products online
+  So that I can shop from home
+
+  @positive @happy
+  Scenario: Successful login
+    Given I am on the login page
+    When I enter "standard_user" as username
+    And I enter "secret_sauce" as password
+    And I click the login button
+    Then I should be redirected to the products page
+
+  @positive @happy
+  Scenario: Add product to cart
+    Given I am logged in
+    When I add "Sauce Labs Backpack" to cart
+    Then the cart should show 1 item
+
+  @negative
+  Scenario: Login with wrong password
+    Given I am on the login page
+    When I enter "standard_user" as username
+    And I enter "wrong_password" as password
+    And I click the login button
+    Then I should see error message
+
+  @negative
+  Scenario: Checkout with empty cart
+    Given I am logged in
+    And my cart is empty
+    When I try to checkout
+    Then checkout should be disabled"""
+
+# WebDriver messages meaning the browser itself is gone, not that a step failed
+SESSION_LOST_MESSAGES = ("not reachable", "disconnected", "session deleted",
+                         "no such session", "invalid session id")
 
 class CompleteRealTester:
-    def __init__(self):
+    def __init__(self, resume=False, metrics_port=None, event_log=None, profile=False,
+                 name_suffix=""):
         self.api_key = None
+        self.resume = resume
+        self.name_suffix = name_suffix
+        self.checkpoint = PipelineCheckpoint(f"pipeline_checkpoint{name_suffix}.json")
+        self.metrics_port = metrics_port
+        self.metrics = PipelineMetrics()
+        self.events = EventLog(event_log)
+        self.profiler = StageProfiler() if profile else None
         self.website_url = "https://www.saucedemo.com"
         self.requirements = ""
         self.generated_gherkin = ""
@@ -26,33 +82,60 @@ class CompleteRealTester:
         self.approved = []
         self.results = []
         self.driver = None
+        self.driver_factory = None
+        self.wait_scale = 1.0
+        self.locators = None
+        self.plan = None
+        self.plan_cache = PlanCache()
         self.reports = []
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.llm_latency = None
+        self.stage_seconds = {}
+        self.prompt_seconds = 0.0
+        self.history_analysis = None
         
+    def _stamp(self):
+        """Timestamp for file names (suffixed per requirement set in batch mode)"""
+        return datetime.now().strftime("%Y%m%d_%H%M%S") + self.name_suffix
+    
     def print_step(self, title):
         print(f"\n{'='*60}")
         print(f"📋 {title}")
         print(f"{'='*60}")
+        self.events.emit("step", title=title)
+    
+    def _wait(self, seconds, reason):
+        """Sleep and record the wait"""
+        seconds *= self.wait_scale
+        time.sleep(seconds)
+        self.metrics.waits.observe(seconds, reason=reason)
+    
+    def _prompt(self, text):
+        """input() whose waiting time is kept out of the stage timings"""
+        started = time.perf_counter()
+        try:
+            return input(text)
+        finally:
+            self.prompt_seconds += time.perf_counter() - started
+    
+    def _add_report(self, filename, kind):
+        """Register a generated file and count its bytes"""
+        self.reports.append(filename)
+        size = os.path.getsize(filename) if os.path.exists(filename) else 0
+        self.metrics.artifact_bytes.inc(size, kind=kind)
+        self.events.emit("artifact", file=filename, kind=kind, bytes=size)
     
     def setup(self):
         """Setup everything"""
         self.print_step("STEP 1: SETUP")
         
-        # Get OpenAI key
-        try:
-            from config import OPENAI_API_KEY
-            self.api_key = OPENAI_API_KEY
-            if self.api_key == "your-actual-key-here":
-                print("❌ Please update config.py with your real OpenAI key")
-                return False
-            print("✅ OpenAI API key loaded")
-        except:
-            print("❌ Create config.py with: OPENAI_API_KEY = 'your-key-here'")
+        if not self._load_api_key():
             return False
         
         # Get requirements
         print("\nEnter business requirements:")
         print("Example: 'Users should login and buy products'")
-        req = input("\nRequirements (or press Enter for demo): ").strip()
+        req = self._prompt("\nRequirements (or press Enter for demo): ").strip()
         
         if not req:
             self.requirements = "Users should be able to login, browse products, add items to cart, and complete checkout"
@@ -62,6 +145,20 @@ class CompleteRealTester:
         print(f"✅ Requirements: {self.requirements}")
         return True
     
+    def _load_api_key(self):
+        """Get OpenAI key"""
+        try:
+            from config import OPENAI_API_KEY
+            self.api_key = OPENAI_API_KEY
+            if self.api_key == "your-actual-key-here":
+                print("❌ Please update config.py with your real OpenAI key")
+                return False
+            print("✅ OpenAI API key loaded")
+        except:
+            print("❌ Create config.py with: OPENAI_API_KEY = 'your-key-here'")
+            return False
+        return True
+    
     def generate_gherkin_with_ai(self):
         """Generate Gherkin scenarios using AI"""
         self.print_step("STEP 2: GHERKIN GENERATION")
@@ -70,42 +167,7 @@ class CompleteRealTester:
         print("🤖 Asking AI to create Gherkin scenarios...")
         
         try:
-            client = openai.OpenAI(api_key=self.api_key)
-            
-            prompt = f"""
-            Create a COMPLETE Gherkin feature file for testing: {self.requirements}
-            Target website: {self.website_url} (demo e-commerce site)
-            
-            Include:
-            1. Feature description
-            2. 3-4 scenarios total
-            3. Tag positive scenarios with @positive @happy
-            4. Tag negative scenarios with @negative
-            5. Use REAL element IDs from the website
-            6. Format: Feature, Scenario, Given, When, Then
-            
-            Real element IDs on {self.website_url}:
-            - Username field: #user-name
-            - Password field: #password  
-            - Login button: #login-button
-            - Add to cart: #add-to-cart-sauce-labs-backpack
-            - Cart icon: .shopping_cart_link
-            - Checkout button: #checkout
-            
-            Output ONLY the Gherkin feature file.
-            """
-            
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a BDD testing expert."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=1500
-            )
-            
-            self.generated_gherkin = response.choices[0].message.content.strip()
+            self.generated_gherkin = self._request_gherkin()
             
             # Parse scenarios
             self.scenarios = self._parse_gherkin()
@@ -131,88 +193,113 @@ class CompleteRealTester:
             
         except Exception as e:
             print(f"❌ AI Error: {e}")
+            self.events.emit("llm_error", error=str(e))
             print("⚠️ Using sample Gherkin...")
             self._use_sample_gherkin()
             return True
     
+    def _request_gherkin(self):
+        """Ask the LLM for a Gherkin feature file"""
+        client = openai.OpenAI(api_key=self.api_key)
+        
+        prompt = f"""
+        Create a COMPLETE Gherkin feature file for testing: {self.requirements}
+        Target website: {self.website_url} (demo e-commerce site)
+        
+        Include:
+        1. Feature description
+        2. 3-4 scenarios total
+        3. Tag positive scenarios with @positive @happy
+        4. Tag negative scenarios with @negative
+        5. Use REAL element IDs from the website
+        6. Format: Feature, Scenario, Given, When, Then
+        7. For data-driven cases (several users or products) use ONE
+           Scenario Outline with <placeholders> and an Examples table
+        
+        Real element IDs on {self.website_url}:
+        - Username field: #user-name
+        - Password field: #password  
+        - Login button: #login-button
+        - Add to cart: #add-to-cart-sauce-labs-backpack
+        - Cart icon: .shopping_cart_link
+        - Checkout button: #checkout
+        
+        Output ONLY the Gherkin feature file.
+        """
+        
+        started = time.perf_counter()
+        response = client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": "You are a BDD testing expert."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,
+            max_tokens=1500
+        )
+        latency = time.perf_counter() - started
+        self.llm_latency = latency
+        self.metrics.llm_latency.observe(latency, model="gpt-3.5-turbo")
+        if response.usage:
+            self.metrics.llm_tokens.inc(response.usage.prompt_tokens, kind="prompt")
+            self.metrics.llm_tokens.inc(response.usage.completion_tokens, kind="completion")
+        self.events.emit("llm_response", latency=round(latency, 3),
+                         tokens=response.usage.total_tokens if response.usage else None)
+        
+        return response.choices[0].message.content.strip()
+    
     def _parse_gherkin(self):
-        """Parse Gherkin into scenarios"""
+        """Parse Gherkin into scenarios (outline Examples stay unexpanded)"""
         scenarios = []
         lines = self.generated_gherkin.split('\n')
         
         current_scenario = None
-        current_steps = []
         current_tags = []
+        in_examples = False
         
         for line in lines:
             line = line.strip()
             
             if line.startswith('@'):
                 current_tags = line.split()
-            elif line.startswith('Scenario:'):
+            elif line.startswith(('Scenario:', 'Scenario Outline:', 'Scenario Template:')):
                 if current_scenario:
-                    scenario_type = 'positive' if '@positive' in ' '.join(current_tags) else 'negative'
-                    scenarios.append({
-                        'name': current_scenario,
-                        'tags': current_tags.copy(),
-                        'type': scenario_type,
-                        'steps': current_steps.copy()
-                    })
+                    scenarios.append(current_scenario)
                 
-                current_scenario = line.replace('Scenario:', '').strip()
-                current_steps = []
+                keyword, name = line.split(':', 1)
+                scenario_type = 'positive' if '@positive' in ' '.join(current_tags) else 'negative'
+                current_scenario = {
+                    'name': name.strip(),
+                    'tags': current_tags.copy(),
+                    'type': scenario_type,
+                    'steps': []
+                }
+                if keyword != 'Scenario':
+                    current_scenario['outline'] = True
+                    current_scenario['examples'] = []
+                current_tags = []
+                in_examples = False
+            elif current_scenario and current_scenario.get('outline') and \
+                    line.startswith(('Examples:', 'Scenarios:')):
+                current_scenario['examples'].append(parse_examples_header(line))
+                in_examples = True
+            elif in_examples and line.startswith('|'):
+                add_table_row(current_scenario['examples'][-1], line)
             elif current_scenario and (line.startswith('Given') or line.startswith('When') or 
                                       line.startswith('Then') or line.startswith('And') or 
                                       line.startswith('But')):
-                current_steps.append(line)
+                current_scenario['steps'].append(line)
         
         # Add last scenario
         if current_scenario:
-            scenario_type = 'positive' if '@positive' in ' '.join(current_tags) else 'negative'
-            scenarios.append({
-                'name': current_scenario,
-                'tags': current_tags.copy(),
-                'type': scenario_type,
-                'steps': current_steps.copy()
-            })
+            scenarios.append(current_scenario)
         
+        self.metrics.scenarios.inc(len(scenarios), outcome="parsed")
         return scenarios
     
     def _use_sample_gherkin(self):
         """Use sample Gherkin if AI fails"""
-        self.generated_gherkin = """Feature: E-commerce Shopping
-  As a customer
-  I want to purchase products online
-  So that I can shop from home
-
-  @positive @happy
-  Scenario: Successful login
-    Given I am on the login page
-    When I enter "standard_user" as username
-    And I enter "secret_sauce" as password
-    And I click the login button
-    Then I should be redirected to the products page
-
-  @positive @happy
-  Scenario: Add product to cart
-    Given I am logged in
-    When I add "Sauce Labs Backpack" to cart
-    Then the cart should show 1 item
-
-  @negative
-  Scenario: Login with wrong password
-    Given I am on the login page
-    When I enter "standard_user" as username
-    And I enter "wrong_password" as password
-    And I click the login button
-    Then I should see error message
-
-  @negative
-  Scenario: Checkout with empty cart
-    Given I am logged in
-    And my cart is empty
-    When I try to checkout
-    Then checkout should be disabled"""
+        self.generated_gherkin = SAMPLE_GHERKIN
         
         self.scenarios = self._parse_gherkin()
         
@@ -225,17 +312,16 @@ class CompleteRealTester:
     
     def _save_gherkin_file(self):
         """Save Gherkin to file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"gherkin_scenarios_{timestamp}.feature"
+        filename = f"gherkin_scenarios_{self._stamp()}.feature"
         
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(self.generated_gherkin)
         
         print(f"📁 Gherkin saved: {filename}")
-        self.reports.append(filename)
+        self._add_report(filename, "gherkin")
     
-    def manual_approval(self):
-        """Manual approval step"""
+    def manual_approval(self, choice=None):
+        """Manual approval step (choice skips the prompt in batch mode)"""
         self.print_step("STEP 3: MANUAL APPROVAL")
         
         print("📋 GENERATED SCENARIOS:")
@@ -244,12 +330,15 @@ class CompleteRealTester:
             print(f"\n{i}. {icon} [{s['type'].upper()}] {s['name']}")
             print(f"   Tags: {' '.join(s['tags'])}")
             print(f"   Steps: {len(s['steps'])}")
+            if s.get('outline'):
+                print(f"   Examples: {describe_examples(s)}")
         
         print(f"\n{'='*60}")
         print("Select scenarios to automate (positive only):")
         print("Enter: 'positive' or numbers like '1,2'")
         
-        choice = input("\nYour choice: ").strip().lower()
+        if choice is None:
+            choice = self._prompt("\nYour choice: ").strip().lower()
         
         if choice == 'positive':
             selected = [i+1 for i, s in enumerate(self.scenarios) if s['type'] == 'positive']
@@ -268,16 +357,25 @@ class CompleteRealTester:
                     print(f"⚠️ Skipping negative scenario {idx}")
         
         print(f"\n✅ Approved {len(self.approved)} positive scenarios")
+        self.metrics.scenarios.inc(len(self.approved), outcome="approved")
+        self.events.emit("approved", scenarios=[s['name'] for s in self.approved])
         
         # Save approval
         self._save_approval_record()
         
         return len(self.approved)
     
+    def _prepare_plan(self):
+        """Compile approved scenarios into an execution plan and cache it"""
+        self.plan = compile_plan(self.generated_gherkin, self.scenarios, self.approved)
+        self.approved = self.plan['scenarios']
+        path = self.plan_cache.save(self.plan)
+        unbound = sum(s['unbound_steps'] for s in self.approved)
+        print(f"🧩 Execution plan compiled: {path} ({unbound} unbound steps)")
+    
     def _save_approval_record(self):
         """Save approval to file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"approval_{timestamp}.json"
+        filename = f"approval_{self._stamp()}.json"
         
         data = {
             "timestamp": datetime.now().isoformat(),
@@ -293,7 +391,7 @@ class CompleteRealTester:
             json.dump(data, f, indent=2)
         
         print(f"📄 Approval saved: {filename}")
-        self.reports.append(filename)
+        self._add_report(filename, "approval")
     
     def execute_real_tests(self):
         """Actually test on real website"""
@@ -305,126 +403,284 @@ class CompleteRealTester:
         
         print(f"🔧 Will execute {len(self.approved)} approved scenarios")
         print("⚠️ This will OPEN REAL CHROME BROWSER!")
-        input("\nPress Enter to open Chrome and start testing...")
+        self._prompt("\nPress Enter to open Chrome and start testing...")
         
         try:
-            # Open REAL browser
-            print("\n🚀 Opening Chrome browser...")
-            self.driver = webdriver.Chrome()
-            print("✅ Chrome opened!")
-            
-            # Go to website
-            print(f"🌐 Navigating to: {self.website_url}")
-            self.driver.get(self.website_url)
-            time.sleep(3)
-            
-            print(f"📄 Page: {self.driver.title}")
-            
-            # Execute tests
-            self.results = []
-            for i, scenario in enumerate(self.approved, 1):
-                result = self._execute_single_test(scenario, i)
-                self.results.append(result)
-            
-            print(f"\n🎯 REAL TESTING COMPLETE: {len(self.results)} tests executed")
-            
-            return self.results
+            self._open_browser()
+            return self._execute_approved()
             
         except Exception as e:
+            if self._session_lost(e):
+                # Leave the remaining scenarios to --resume instead of failing them
+                print(f"💥 Browser session lost: {e}")
+                print("💾 Finished scenarios are checkpointed - re-run with --resume")
+                self.events.emit("execution_error", error=str(e), session_lost=True)
+                raise
             print(f"❌ Real testing failed: {e}")
+            self.events.emit("execution_error", error=str(e))
             print("⚠️ Falling back to simulation...")
             return self._execute_simulated_tests()
     
+    def _open_browser(self):
+        """Open REAL browser on the website"""
+        print("\n🚀 Opening Chrome browser...")
+        self.driver = (self.driver_factory or webdriver.Chrome)()
+        self.metrics.driver_pool_size.set(1)
+        self.locators = SelfHealingLocator(self.driver, LocatorCache(), self.metrics, self.events)
+        if self.plan:
+            self.locators.use_plan(self.plan['locators'])
+        print("✅ Chrome opened!")
+        
+        # Go to website
+        print(f"🌐 Navigating to: {self.website_url}")
+        self.driver.get(self.website_url)
+        self._wait(3, "page_load")
+        
+        print(f"📄 Page: {self.driver.title}")
+    
+    def _execute_approved(self):
+        """Execute approved scenarios on the open browser"""
+        # Skip scenarios finished before a crash
+        finished = self.checkpoint.finished_ids()
+        self.results = list(self.checkpoint.state["results"])
+        for i, scenario in enumerate(self.approved, 1):
+            if i in finished:
+                print(f"\n⏭️ Test {i}: {scenario['name']} (already finished)")
+                continue
+            self.metrics.drivers_in_use.set(1)
+            if not scenario.get('outline'):
+                # Scenarios must not see each other's login or cart (outline rows reset themselves)
+                self._reset_session()
+            result = self._run_scenario(scenario, i, self._execute_single_test, "real_test")
+            self.metrics.drivers_in_use.set(0)
+            self.results.append(result)
+            self.checkpoint.save_result(result, self.reports)
+        
+        print(f"\n🎯 REAL TESTING COMPLETE: {len(self.results)} tests executed")
+        
+        return self.results
+    
+    def _run_scenario(self, scenario, test_id, runner, result_type):
+        """Run a scenario, streaming outline rows through the runner one at a time"""
+        if not scenario.get('outline'):
+            return runner(scenario, test_id)
+        
+        recorder = OutlineRecorder(test_id, scenario['name'],
+                                   f"outline_{self.run_id}{self.name_suffix}_{test_id}.jsonl")
+        print(f"\n📑 Outline {test_id}: {scenario['name']} ({describe_examples(scenario)})")
+        if recorder.done:
+            print(f"  ⏭️ Resuming after row {recorder.done}")
+        try:
+            for case in expand_outline(scenario, start=recorder.done):
+                # Each row starts logged out on the start page, like a fresh scenario
+                if self.driver:
+                    self._reset_session()
+                result = runner(case, f"{test_id}.{case['example_index']}")
+                recorder.record(case['example_index'], result)
+        finally:
+            recorder.close()
+        
+        print(f"  📊 Rows: {recorder.passed}/{recorder.done} passed")
+        return recorder.summary(result_type)
+    
+    def _reset_session(self):
+        """Clear cookies and web storage (saucedemo keeps the cart there), then reload"""
+        if self.driver.current_url.startswith(self.website_url):
+            # Storage is per origin, so clear it while still on the site
+            self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        self.driver.delete_all_cookies()
+        self.driver.get(self.website_url)
+    
+    def _session_lost(self, error):
+        """True when an error means the browser crashed or its session is gone"""
+        if isinstance(error, (InvalidSessionIdException, NoSuchWindowException,
+                              ConnectionError, MaxRetryError, ProtocolError)):
+            return True
+        return (isinstance(error, WebDriverException)
+                and any(m in str(error).lower() for m in SESSION_LOST_MESSAGES))
+    
     def _execute_single_test(self, scenario, test_id):
         """Execute a single test on real website"""
         print(f"\n🧪 Test {test_id}: {scenario['name']}")
         print("-" * 40)
+        self.events.emit("scenario_start", id=test_id, name=scenario['name'])
+        started = time.perf_counter()
+        screenshot = None
+        skipped = []
         
         try:
-            # Simple real test - always passes for demo
-            if "login" in scenario['name'].lower():
-                # Test login
-                self.driver.find_element(By.ID, "user-name").send_keys("standard_user")
-                self.driver.find_element(By.ID, "password").send_keys("secret_sauce")
-                self.driver.find_element(By.ID, "login-button").click()
-                time.sleep(2)
-                
-                if "inventory" in self.driver.current_url:
-                    print("  ✅ Login successful")
-                    status = "PASSED"
-                else:
-                    print("  ❌ Login failed")
-                    status = "FAILED"
-                    
-            elif "cart" in scenario['name'].lower():
-                # Test add to cart
-                if "inventory" not in self.driver.current_url:
-                    # Login first
-                    self.driver.get(self.website_url)
-                    time.sleep(2)
-                    self.driver.find_element(By.ID, "user-name").send_keys("standard_user")
-                    self.driver.find_element(By.ID, "password").send_keys("secret_sauce")
-                    self.driver.find_element(By.ID, "login-button").click()
-                    time.sleep(2)
-                
-                self.driver.find_element(By.ID, "add-to-cart-sauce-labs-backpack").click()
-                time.sleep(1)
-                
-                cart_badge = self.driver.find_element(By.CLASS_NAME, "shopping_cart_badge")
-                print(f"  ✅ Cart updated: {cart_badge.text} item(s)")
-                status = "PASSED"
-                
-            else:
-                print("  ⚠️ Generic test - assuming passed")
-                status = "PASSED"
+            # Steps come from the compiled plan; uncompiled scenarios are bound here
+            bindings = scenario.get('bindings') or [bind_step(step) for step in scenario['steps']]
+            if 'example' in scenario:
+                # A template step can be unbound only because of its <placeholder>
+                bindings = [bind_step(b['step']) if b['action'] == 'unbound' else b
+                            for b in bindings]
+            status, skipped = self._run_bindings(bindings)
             
-            # Take screenshot
-            screenshot = f"test_{test_id}_{datetime.now().strftime('%H%M%S')}.png"
-            self.driver.save_screenshot(screenshot)
-            print(f"  📸 Screenshot: {screenshot}")
-            self.reports.append(screenshot)
+            # Take screenshot (outline rows are recorded compactly instead)
+            if 'example' not in scenario:
+                screenshot = f"test_{test_id}_{datetime.now().strftime('%H%M%S')}{self.name_suffix}.png"
+                self.driver.save_screenshot(screenshot)
+                print(f"  📸 Screenshot: {screenshot}")
+                self._add_report(screenshot, "screenshot")
             
         except Exception as e:
+            if self._session_lost(e):
+                # Not a scenario failure: no result is recorded, so --resume re-runs it
+                raise
             print(f"  ❌ Test error: {e}")
             status = "FAILED"
         
-        return {
+        elapsed = time.perf_counter() - started
+        self._record_scenario(test_id, scenario['name'], status, elapsed)
+        
+        result = {
             "id": test_id,
             "name": scenario['name'],
             "status": status,
-            "time": f"{random.uniform(2.0, 5.0):.1f}s",
+            "time": f"{elapsed:.1f}s",
             "type": "real_test"
         }
+        if screenshot:
+            result["screenshot"] = screenshot
+        if skipped:
+            result["skipped_steps"] = skipped
+        return result
+    
+    def _run_bindings(self, bindings):
+        """Run a scenario's step bindings in order; returns (status, skipped steps)"""
+        skipped = [b['step'] for b in bindings if b['action'] == 'unbound']
+        if len(skipped) == len(bindings):
+            print("  ⚠️ No step definitions matched - assuming passed")
+            return "PASSED", skipped
+        
+        for binding in bindings:
+            if binding['action'] == 'unbound':
+                print(f"  ⚠️ Skipped (no step definition): {binding['step']}")
+                continue
+            if not self._run_step(binding):
+                print(f"  ❌ {binding['step']}")
+                return "FAILED", skipped
+            if binding['wait']:
+                reason, seconds = binding['wait']
+                self._wait(seconds, reason)
+            print(f"  ✅ {binding['step']}")
+        return "PASSED", skipped
+    
+    def _element(self, binding, index):
+        """Find the binding's index-th element through the self-healing locators"""
+        page, element = binding['elements'][index].split(':')
+        return self.locators.find(page, element)
+    
+    def _run_step(self, binding):
+        """Perform one bound step; False when its check fails"""
+        action = binding['action']
+        params = binding['params']
+        
+        if action == "open_login":
+            self.driver.get(self.website_url)
+        elif action == "login":
+            if "inventory" not in self.driver.current_url:
+                self.driver.get(self.website_url)
+                self._element(binding, 0).send_keys(params.get('username', "standard_user"))
+                self._element(binding, 1).send_keys(params.get('password', "secret_sauce"))
+                self._element(binding, 2).click()
+        elif action == "type_username":
+            self._element(binding, 0).send_keys(params['username'])
+        elif action == "type_password":
+            self._element(binding, 0).send_keys(params['password'])
+        elif action in ("click_login", "add_to_cart"):
+            self._element(binding, 0).click()
+        elif action == "assert_cart_count":
+            count = self._element(binding, 0).text
+            print(f"  🛒 Cart shows {count} item(s)")
+            return count == params['count']
+        elif action == "assert_products_page":
+            return "inventory" in self.driver.current_url
+        return True
+    
+    def _record_scenario(self, test_id, name, status, elapsed):
+        """Record metrics and event for a finished scenario"""
+        self.metrics.scenario_duration.observe(elapsed)
+        self.metrics.scenarios.inc(outcome="executed")
+        self.metrics.scenarios.inc(outcome=status.lower())
+        self.events.emit("scenario_end", id=test_id, name=name, status=status,
+                         seconds=round(elapsed, 3))
+    
+    def compare_screenshots(self):
+        """Visual assertion of screenshots against stored baselines"""
+        if not any(r.get('screenshot') for r in self.results):
+            return
+        
+        self.print_step("STEP 4b: VISUAL COMPARISON")
+        try:
+            from visual import compare_run
+        except ImportError:
+            print("⚠️ numpy/Pillow not installed - skipping visual comparison")
+            return
+        
+        outcome = compare_run(self.results, f"visual_diffs_{self._stamp()}")
+        for result in self.results:
+            visual = outcome.get(result['id'])
+            if not visual:
+                continue
+            result['visual'] = visual
+            self.metrics.scenarios.inc(outcome=f"visual_{visual['status'].lower()}")
+            
+            if visual['status'] == 'MISMATCH':
+                print(f"  ❌ {result['name']}: visual mismatch ({visual['check']}, "
+                      f"hash distance {visual['hash_distance']}, diff {visual['diff_ratio']})")
+                if result['status'] == 'PASSED':
+                    result['functional_status'] = result['status']
+                    result['status'] = 'FAILED'
+            elif visual['status'] == 'MATCH':
+                print(f"  ✅ {result['name']}: matches baseline")
+            else:
+                print(f"  ⚠️ {result['name']}: {visual['status']}")
+            
+            if 'diff_image' in visual:
+                self._add_report(visual['diff_image'], "visual_diff")
     
     def _execute_simulated_tests(self):
         """Fallback simulated tests"""
         print("Running simulated tests...")
         
-        self.results = []
+        finished = self.checkpoint.finished_ids()
+        self.results = list(self.checkpoint.state["results"])
         for i, scenario in enumerate(self.approved, 1):
-            print(f"\n🧪 Test {i}: {scenario['name']} (simulated)")
-            print("-" * 40)
-            
-            time.sleep(1)
-            print("  ⚡ Simulating test execution...")
-            time.sleep(0.5)
-            
-            # 90% pass rate
-            passed = random.random() > 0.1
-            status = "PASSED" if passed else "FAILED"
-            
-            print(f"  📊 Result: {status}")
-            
-            self.results.append({
-                "id": i,
-                "name": scenario['name'],
-                "status": status,
-                "time": f"{random.uniform(1.5, 3.0):.1f}s",
-                "type": "simulated"
-            })
+            if i in finished:
+                continue
+            result = self._run_scenario(scenario, i, self._simulate_single_test, "simulated")
+            self.results.append(result)
+            self.checkpoint.save_result(result, self.reports)
         
         return self.results
     
+    def _simulate_single_test(self, scenario, test_id):
+        """Simulate a single test"""
+        print(f"\n🧪 Test {test_id}: {scenario['name']} (simulated)")
+        print("-" * 40)
+        started = time.perf_counter()
+        
+        self._wait(1, "simulated")
+        print("  ⚡ Simulating test execution...")
+        self._wait(0.5, "simulated")
+        
+        # 90% pass rate
+        passed = random.random() > 0.1
+        status = "PASSED" if passed else "FAILED"
+        
+        print(f"  📊 Result: {status}")
+        self._record_scenario(test_id, scenario['name'], status, time.perf_counter() - started)
+        
+        return {
+            "id": test_id,
+            "name": scenario['name'],
+            "status": status,
+            "time": f"{random.uniform(1.5, 3.0):.1f}s",
+            "type": "simulated"
+        }
+    
     def generate_complete_report(self):
         """Generate complete report with all details"""
         self.print_step("STEP 5: COMPLETE REPORT")
@@ -461,6 +717,9 @@ class CompleteRealTester:
         # Generate JSON report
         self._generate_json_report(total_scenarios, positive, negative, approved, executed, passed, failed, success_rate)
         
+        # Compare with run history (includes the JSON report just written)
+        self._analyze_history()
+        
         # Generate HTML report
         self._generate_html_report(total_scenarios, positive, negative, approved, executed, passed, failed, success_rate)
         
@@ -473,7 +732,7 @@ class CompleteRealTester:
     
     def _generate_json_report(self, total, pos, neg, approved, executed, passed, failed, success_rate):
         """Generate JSON report"""
-        filename = f"complete_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = f"complete_report_{self._stamp()}.json"
         
         report = {
             "project": "Complete LLM-BDD Testing System",
@@ -497,18 +756,45 @@ class CompleteRealTester:
                 "failed": failed,
                 "success_rate": f"{success_rate:.1f}%"
             },
+            "timings": {
+                "llm_latency_seconds": self.llm_latency,
+                "stages": self.stage_seconds
+            },
+            "locator_heals": self.locators.heals if self.locators else [],
             "files_generated": self.reports
         }
+        if self.profiler:
+            report["profile"] = {
+                "output_dir": self.profiler.output_dir,
+                "stages": self.profiler.stages
+            }
         
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(report, f, indent=2)
         
         print(f"  📊 JSON Report: {filename}")
-        self.reports.append(filename)
+        self._add_report(filename, "json_report")
+    
+    def _analyze_history(self):
+        """Flag duration regressions against past reports"""
+        try:
+            from history_analysis import run_analysis
+        except ImportError:
+            print("  ⚠️ numpy not installed - skipping history analysis")
+            return
+        
+        try:
+            self.history_analysis, filename = run_analysis()
+            print(f"  📈 History Analysis: {filename}")
+            self._add_report(filename, "history_analysis")
+            for name in self.history_analysis['flagged']:
+                print(f"  ⚠️ Duration regression: {name}")
+        except Exception as e:
+            print(f"  ⚠️ History analysis failed: {e}")
     
     def _generate_html_report(self, total, pos, neg, approved, executed, passed, failed, success_rate):
         """Generate HTML report"""
-        filename = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+        filename = f"report_{self._stamp()}.html"
         
         html = f"""<!DOCTYPE html>
 <html>
@@ -562,6 +848,43 @@ class CompleteRealTester:
             status_class = "passed" if result['status'] == 'PASSED' else "failed"
             html += f'    <div class="result {status_class}">{result["status"]} - {result["name"]} ({result["time"]})</div>\n'
         
+        visual_results = [r for r in self.results if 'visual' in r]
+        if visual_results:
+            html += """
+    <h2>Visual Comparison</h2>
+    <table border="1" cellpadding="5">
+        <tr><th>Scenario</th><th>Visual</th><th>Check</th><th>Hash Distance</th><th>Diff Ratio</th><th>Diff</th></tr>
+"""
+            for r in visual_results:
+                v = r['visual']
+                diff = f'<img src="{v["diff_image"]}" width="240">' if 'diff_image' in v else ""
+                html += f'        <tr><td>{r["name"]}</td><td>{v["status"]}</td><td>{v.get("check", "")}</td><td>{v.get("hash_distance", "")}</td><td>{v.get("diff_ratio", "")}</td><td>{diff}</td></tr>\n'
+            html += "    </table>\n"
+        
+        if self.locators and self.locators.heals:
+            html += """
+    <h2>Healed Locators (review and update)</h2>
+    <table border="1" cellpadding="5">
+        <tr><th>Page</th><th>Element</th><th>Broken</th><th>Healed</th><th>URL</th></tr>
+"""
+            for heal in self.locators.heals:
+                html += f'        <tr><td>{heal["page"]}</td><td>{heal["element"]}</td><td>{heal["broken"]}</td><td>{heal["healed"]}</td><td>{heal["url"]}</td></tr>\n'
+            html += "    </table>\n"
+        
+        if self.history_analysis:
+            from history_analysis import html_section
+            html += html_section(self.history_analysis)
+        
+        if self.profiler:
+            html += """
+    <h2>Stage Profile</h2>
+    <table border="1" cellpadding="5">
+        <tr><th>Stage</th><th>CPU (s)</th><th>Wall (s)</th><th>Peak Memory (KB)</th></tr>
+"""
+            for s in self.profiler.stages:
+                html += f'        <tr><td>{s["stage"]}</td><td>{s["cpu_seconds"]:.3f}</td><td>{s["wall_seconds"]:.3f}</td><td>{s["peak_memory_kb"]:.1f}</td></tr>\n'
+            html += "    </table>\n"
+        
         html += f"""
     <h2>Generated Files</h2>
     <ul>
@@ -578,11 +901,11 @@ class CompleteRealTester:
             f.write(html)
         
         print(f"  🌐 HTML Report: {filename}")
-        self.reports.append(filename)
+        self._add_report(filename, "html_report")
     
     def _generate_text_summary(self, total, pos, neg, approved, executed, passed, failed, success_rate):
         """Generate text summary"""
-        filename = "execution_summary.txt"
+        filename = f"execution_summary{self.name_suffix}.txt"
         
         summary = f"""COMPLETE LLM-BDD TESTING SYSTEM
 ===========================================
@@ -613,6 +936,23 @@ DETAILED RESULTS:
         for result in self.results:
             summary += f"- {result['status']}: {result['name']} ({result['time']})\n"
         
+        visual_results = [r for r in self.results if 'visual' in r]
+        if visual_results:
+            summary += "\nVISUAL COMPARISON:\n"
+            for r in visual_results:
+                summary += f"- {r['visual']['status']}: {r['name']} (diff {r['visual'].get('diff_ratio')})\n"
+        
+        if self.locators and self.locators.heals:
+            summary += "\nHEALED LOCATORS:\n"
+            for heal in self.locators.heals:
+                summary += f"- {heal['page']}:{heal['element']}: {heal['broken']} -> {heal['healed']}\n"
+        
+        if self.profiler:
+            summary += f"""
+STAGE PROFILE ({self.profiler.output_dir}):
+{self.profiler.summary_table()}
+"""
+        
         summary += f"""
 GENERATED FILES:
 """
@@ -624,36 +964,219 @@ GENERATED FILES:
             f.write(summary)
         
         print(f"  📄 Text Summary: {filename}")
-        self.reports.append(filename)
+        self._add_report(filename, "text_summary")
     
     def cleanup(self):
         """Cleanup resources"""
         if self.driver:
             print("\nClosing Chrome browser...")
-            self.driver.quit()
-            print("✅ Browser closed")
+            try:
+                self.driver.quit()
+                print("✅ Browser closed")
+            except Exception as e:
+                print(f"⚠️ Browser already gone: {e}")
+            self.metrics.driver_pool_size.set(0)
+        self.metrics.stop_server()
+        if self.profiler and self.profiler.stages:
+            path = self.profiler.close()
+            print("\n⏱️ STAGE PROFILE:")
+            print(self.profiler.summary_table())
+            print(f"📁 Profile data: {self.profiler.output_dir} (summary: {path})")
+    
+    def _restore_checkpoint(self):
+        """Restore pipeline state saved by an interrupted run"""
+        self.print_step("RESUMING FROM CHECKPOINT")
+        
+        state = self.checkpoint.load()
+        self.requirements = state.get('requirements', "")
+        self.run_id = state.get('run_id', self.run_id)
+        self.generated_gherkin = state.get('generated_gherkin', "")
+        self.scenarios = state.get('scenarios', [])
+        self.approved = state.get('approved', [])
+        self.results = list(state['results'])
+        self.reports = state.get('reports', [])
+        
+        print(f"✅ Completed stages: {', '.join(state['completed_stages']) or 'none'}")
+        print(f"✅ Finished scenarios: {len(self.results)}/{len(self.approved)}")
+        if self.checkpoint.is_done('generation'):
+            self.metrics.cache_hits.inc(cache="checkpoint")
+        self.events.emit("resume", stages=state['completed_stages'], finished=len(self.results))
+    
+    @contextmanager
+    def _timed_step(self, step):
+        """Time a pipeline step (and profile it in --profile mode)
+
+        Time spent waiting at prompts is left out, so stage timings (and the
+        history regression checks on them) measure the pipeline, not the user.
+        """
+        started = time.perf_counter()
+        prompted = self.prompt_seconds
+        try:
+            if self.profiler:
+                with self.profiler.profile(step):
+                    yield
+            else:
+                yield
+        finally:
+            elapsed = time.perf_counter() - started - (self.prompt_seconds - prompted)
+            self.stage_seconds[step] = round(elapsed, 3)
+            self.metrics.step_duration.observe(elapsed, step=step)
+            self.events.emit("step_end", step=step, seconds=round(elapsed, 3))
+    
+    def run_soak(self, total, recycle_every=200, memory_limit_mb=1500):
+        """Run approved scenarios repeatedly with bounded memory"""
+        try:
+            if self.metrics_port is not None:
+                self.metrics.start_server(self.metrics_port)
+            
+            if not self.setup():
+                return
+            self.generate_gherkin_with_ai()
+            if self.manual_approval() == 0:
+                print("\n❌ No scenarios approved for execution")
+                return
+            self._prepare_plan()
+            
+            self.print_step(f"SOAK: {total} SCENARIOS (recycle every {recycle_every})")
+            report = SoakRunner(self, total, recycle_every, memory_limit_mb).run()
+            
+            print(f"\n🎯 SOAK COMPLETE: {report['passed']}/{report['executed']} passed, "
+                  f"{report['recycles']} browser recycles")
+            print(f"  RSS: {report['rss_start_mb']} MB -> {report['rss_end_mb']} MB "
+                  f"(peak {report['rss_peak_mb']} MB)")
+            
+        except KeyboardInterrupt:
+            print("\n⚠️ Process interrupted")
+        finally:
+            self.cleanup()
+    
+    def run_feature(self, feature_file):
+        """Run a saved feature file, reusing its compiled execution plan when warm"""
+        # Not resumable: keep per-scenario saves away from a normal run's checkpoint
+        self.checkpoint = PipelineCheckpoint(f"pipeline_checkpoint_feature{self.name_suffix}.json")
+        try:
+            if self.metrics_port is not None:
+                self.metrics.start_server(self.metrics_port)
+            
+            self.print_step(f"FEATURE FILE: {feature_file}")
+            with open(feature_file, 'r', encoding='utf-8') as f:
+                self.generated_gherkin = f.read().strip()
+            self.requirements = f"Feature file {feature_file}"
+            
+            with self._timed_step('plan'):
+                plan = self.plan_cache.load(self.generated_gherkin)
+                if plan:
+                    self.plan = plan
+                    self.scenarios = plan['all_scenarios']
+                    self.approved = plan['scenarios']
+                    self.metrics.cache_hits.inc(cache="plan")
+                    print(f"⚡ Using precompiled plan {plan['key']} "
+                          f"({len(self.approved)} approved scenarios, compiled {plan['compiled']})")
+                else:
+                    print("🧩 No compiled plan for this feature text - compiling")
+                    self.scenarios = self._parse_gherkin()
+                    if self.manual_approval() == 0:
+                        print("\n❌ No scenarios approved for execution")
+                        return
+                    self._prepare_plan()
+            
+            with self._timed_step('execution'):
+                self.execute_real_tests()
+            with self._timed_step('visual'):
+                self.compare_screenshots()
+            with self._timed_step('reporting'):
+                self.generate_complete_report()
+            
+        except KeyboardInterrupt:
+            print("\n⚠️ Process interrupted")
+        finally:
+            self.checkpoint.clear()
+            self.cleanup()
+    
+    def run_batch(self, requirement_sets, approve="positive", queue_size=2):
+        """Run many requirement sets through the pipelined stages"""
+        try:
+            if self.metrics_port is not None:
+                self.metrics.start_server(self.metrics_port)
+            
+            self.print_step(f"PIPELINED BATCH: {len(requirement_sets)} REQUIREMENT SETS")
+            if not self._load_api_key():
+                return
+            
+            batch = BatchPipeline(self, requirement_sets, approve, queue_size)
+            jobs = batch.run()
+            
+            print("\n" + "="*80)
+            print(f"🎉 BATCH COMPLETE: {len(jobs)}/{len(requirement_sets)} requirement sets reported")
+            print("="*80)
+            print("\n⚙️ STAGE UTILIZATION:")
+            print(batch.utilization_table())
+            
+        except KeyboardInterrupt:
+            print("\n⚠️ Process interrupted")
+        finally:
+            self.cleanup()
     
     def run(self):
         """Run complete system"""
         try:
+            if self.metrics_port is not None:
+                self.metrics.start_server(self.metrics_port)
+            
+            if self.resume and self.checkpoint.exists():
+                self._restore_checkpoint()
+            elif self.resume:
+                print("\n⚠️ No checkpoint found - starting a fresh run")
+            
             # Step 1: Setup
-            if not self.setup():
-                return
+            if not self.checkpoint.is_done('setup'):
+                with self._timed_step('setup'):
+                    ready = self.setup()
+                if not ready:
+                    return
+                self.checkpoint.save_stage('setup', requirements=self.requirements,
+                                           run_id=self.run_id)
             
             # Step 2: Generate Gherkin
-            self.generate_gherkin_with_ai()
+            if not self.checkpoint.is_done('generation'):
+                # A resumed run skips setup, which is where the key is loaded
+                if self.api_key is None and not self._load_api_key():
+                    return
+                with self._timed_step('generation'):
+                    self.generate_gherkin_with_ai()
+                self.checkpoint.save_stage('generation',
+                                           generated_gherkin=self.generated_gherkin,
+                                           scenarios=self.scenarios,
+                                           reports=self.reports)
             
             # Step 3: Manual approval
-            approved_count = self.manual_approval()
-            if approved_count == 0:
-                print("\n❌ No scenarios approved for execution")
-                return
+            if not self.checkpoint.is_done('approval'):
+                with self._timed_step('approval'):
+                    approved_count = self.manual_approval()
+                if approved_count == 0:
+                    print("\n❌ No scenarios approved for execution")
+                    self.checkpoint.clear()
+                    return
+                self._prepare_plan()
+                self.checkpoint.save_stage('approval', approved=self.approved,
+                                           reports=self.reports)
             
             # Step 4: Execute tests
-            self.execute_real_tests()
+            if not self.checkpoint.is_done('execution'):
+                with self._timed_step('execution'):
+                    self.execute_real_tests()
+                self.checkpoint.save_stage('execution', reports=self.reports)
+            
+            # Step 4b: Visual comparison
+            if not self.checkpoint.is_done('visual'):
+                with self._timed_step('visual'):
+                    self.compare_screenshots()
+                self.checkpoint.save_stage('visual', results=self.results, reports=self.reports)
             
             # Step 5: Generate reports
-            self.generate_complete_report()
+            with self._timed_step('reporting'):
+                self.generate_complete_report()
+            self.checkpoint.clear()
             
             # Final success message
             print("\n" + "="*80)
@@ -687,6 +1210,10 @@ GENERATED FILES:
             self.cleanup()
 
 def main():
+    print("=" * 80)
+    print("🌐 COMPLETE REAL LLM-BDD TESTING SYSTEM")
+    print("=" * 80)
+    
     # Install requirements if needed
     print("Checking requirements...")
     
@@ -699,9 +1226,44 @@ def main():
         subprocess.check_call([sys.executable, "-m", "pip", "install", "openai", "selenium"])
         print("✅ Packages installed")
     
+    parser = argparse.ArgumentParser(description="Complete LLM-BDD Testing System")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted run from its checkpoint")
+    parser.add_argument("--metrics-port", type=int,
+                        help="serve Prometheus metrics on this local port")
+    parser.add_argument("--event-log", metavar="FILE",
+                        help="write structured JSON-lines events to FILE")
+    parser.add_argument("--profile", action="store_true",
+                        help="profile CPU and memory of each pipeline stage")
+    parser.add_argument("--feature", metavar="FILE",
+                        help="run a saved .feature file using its cached execution plan")
+    parser.add_argument("--soak", type=int, metavar="N",
+                        help="soak mode: execute approved scenarios N times in total")
+    parser.add_argument("--recycle-every", type=int, default=200,
+                        help="soak mode: restart the browser after this many scenarios")
+    parser.add_argument("--browser-memory-limit", type=int, default=1500, metavar="MB",
+                        help="soak mode: restart the browser above this memory")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="pipeline many requirement sets (one per line in FILE)")
+    parser.add_argument("--approve", default="positive",
+                        help="approval choice used in batch mode (default: positive)")
+    parser.add_argument("--queue-size", type=int, default=2,
+                        help="bounded queue size between batch stages")
+    args = parser.parse_args()
+    
     # Run the system
-    tester = CompleteRealTester()
-    tester.run()
+    tester = CompleteRealTester(resume=args.resume, metrics_port=args.metrics_port,
+                                event_log=args.event_log, profile=args.profile)
+    if args.feature:
+        tester.run_feature(args.feature)
+    elif args.soak:
+        tester.run_soak(args.soak, args.recycle_every, args.browser_memory_limit)
+    elif args.batch:
+        with open(args.batch, 'r', encoding='utf-8') as f:
+            requirement_sets = [line.strip() for line in f if line.strip()]
+        tester.run_batch(requirement_sets, args.approve, args.queue_size)
+    else:
+        tester.run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
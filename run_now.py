@@ -9,7 +9,7 @@ print("Setting up LLM-BDD Testing System...")
 
 # Install dependencies
 print("\nInstalling dependencies...")
-subprocess.check_call([sys.executable, "-m", "pip", "install", "openai", "selenium", "webdriver-manager"])
+subprocess.check_call([sys.executable, "-m", "pip", "install", "openai", "selenium", "webdriver-manager", "numpy", "Pillow"])
 
 print("\n✅ Dependencies installed!")
 print("\n📝 IMPORTANT: Edit config.py with your OpenAI API key")
@@ -10,7 +10,7 @@ call venv\Scripts\activate
 REM Install dependencies
 echo.
 echo 2. Installing dependencies...
-pip install openai==1.3.0 selenium==4.16.0 webdriver-manager==4.0.1
+pip install openai==1.3.0 selenium==4.16.0 webdriver-manager==4.0.1 numpy==2.1.3 Pillow==11.0.0
 
 echo.
 echo 3. Setup complete!
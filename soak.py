@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Soak Mode for LLM-BDD System
+Long runs with bounded memory: spilled results, driver recycling, memory sampling
+"""
+import json
+import os
+import time
+from datetime import datetime
+
+MB = 1024 * 1024
+
+def process_rss_mb(pid=None):
+    """Resident memory of a process (this one by default)"""
+    try:
+        import psutil
+        return round(psutil.Process(pid or os.getpid()).memory_info().rss / MB, 1)
+    except ImportError:
+        pass
+    status = f"/proc/{pid or 'self'}/status"
+    if os.path.exists(status):
+        with open(status, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    return None
+
+def browser_memory_mb(driver):
+    """Memory of the browser: driver process tree if psutil is available, else JS heap"""
+    try:
+        import psutil
+        root = psutil.Process(driver.service.process.pid)
+        procs = [root] + root.children(recursive=True)
+        return round(sum(p.memory_info().rss for p in procs) / MB, 1)
+    except Exception:
+        pass
+    try:
+        heap = driver.execute_script(
+            "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null")
+        return round(heap / MB, 1) if heap else None
+    except Exception:
+        return None
+
+class SpillList:
+    """Append-only list kept on disk as JSON lines; only the count stays in memory"""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.count = 0
+        self.file = open(filename, 'a', encoding='utf-8')
+
+    def append(self, item):
+        self.file.write(json.dumps(item) + "\n")
+        self.count += 1
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        if not self.file.closed:
+            self.file.flush()
+        with open(self.filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+
+    def close(self):
+        self.file.close()
+
+class SoakRunner:
+    def __init__(self, tester, total, recycle_every=200, memory_limit_mb=1500, sample_every=100):
+        self.tester = tester
+        self.total = total
+        self.recycle_every = recycle_every
+        self.memory_limit_mb = memory_limit_mb
+        self.sample_every = sample_every
+        self.stamp = tester._stamp()
+        self.samples_file = f"soak_memory_{self.stamp}.jsonl"
+        self.samples = SpillList(self.samples_file)
+        self.passed = 0
+        self.failed = 0
+        self.recycles = 0
+        self.last_browser_mb = None
+        self.since_recycle = 0
+
+    def _sample(self, executed):
+        """Record process RSS and browser memory"""
+        self.last_browser_mb = browser_memory_mb(self.tester.driver)
+        sample = {
+            "t": round(time.perf_counter() - self.started, 1),
+            "scenarios": executed,
+            "rss_mb": process_rss_mb(),
+            "browser_mb": self.last_browser_mb,
+            "recycles": self.recycles
+        }
+        self.samples.append(sample)
+        self.tester.events.emit("soak_sample", **sample)
+        return sample
+
+    def _recycle(self, reason):
+        """Replace the browser with a fresh one"""
+        print(f"♻️ Recycling browser after {self.since_recycle} scenarios ({reason})")
+        try:
+            self.tester.driver.quit()
+        except Exception:
+            pass  # a crashed browser cannot be quit cleanly
+        self.tester._open_browser()
+        self.recycles += 1
+        self.since_recycle = 0
+        self.tester.events.emit("driver_recycled", reason=reason, recycles=self.recycles)
+
+    def run(self):
+        """Execute approved scenarios round-robin until `total` have run"""
+        tester = self.tester
+        tester.results = SpillList(f"soak_results_{self.stamp}.jsonl")
+        tester.reports = SpillList(f"soak_artifacts_{self.stamp}.jsonl")
+        self.started = time.perf_counter()
+        tester._open_browser()
+        self._sample(0)
+
+        try:
+            for n in range(1, self.total + 1):
+                scenario = tester.approved[(n - 1) % len(tester.approved)]
+                tester.metrics.drivers_in_use.set(1)
+                try:
+                    # Fresh session per scenario so runs do not depend on each other
+                    tester._reset_session()
+                    result = tester._run_scenario(scenario, n, tester._execute_single_test, "real_test")
+                except Exception as e:
+                    if not tester._session_lost(e):
+                        raise
+                    result = {"id": n, "name": scenario['name'], "status": "FAILED",
+                              "time": "0.0s", "type": "real_test", "error": str(e)}
+                    self.since_recycle = self.recycle_every  # replace the dead browser below
+                tester.metrics.drivers_in_use.set(0)
+                tester.results.append(result)
+                if result['status'] == 'PASSED':
+                    self.passed += 1
+                else:
+                    self.failed += 1
+                self.since_recycle += 1
+
+                if n % self.sample_every == 0:
+                    self._sample(n)
+                if self.since_recycle >= self.recycle_every:
+                    self._recycle("scenario limit")
+                elif self.last_browser_mb and self.last_browser_mb > self.memory_limit_mb:
+                    self._recycle(f"browser memory {self.last_browser_mb} MB")
+                    self.last_browser_mb = None
+        finally:
+            self._sample(self.passed + self.failed)
+            tester.results.close()
+            tester.reports.close()
+            self.samples.close()
+
+        return self.write_report()
+
+    def write_report(self):
+        """Soak summary with the memory timeline"""
+        samples = list(self.samples)
+        rss = [s['rss_mb'] for s in samples if s['rss_mb'] is not None]
+        executed = self.passed + self.failed
+        report = {
+            "project": "Complete LLM-BDD Testing System - Soak",
+            "timestamp": datetime.now().isoformat(),
+            "website_tested": self.tester.website_url,
+            "executed": executed,
+            "passed": self.passed,
+            "failed": self.failed,
+            "success_rate": f"{(self.passed / executed * 100) if executed else 0:.1f}%",
+            "recycle_every": self.recycle_every,
+            "browser_memory_limit_mb": self.memory_limit_mb,
+            "recycles": self.recycles,
+            "rss_start_mb": rss[0] if rss else None,
+            "rss_peak_mb": max(rss) if rss else None,
+            "rss_end_mb": rss[-1] if rss else None,
+            "memory_samples": samples,
+            "results_file": self.tester.results.filename,
+            "artifacts_file": self.tester.reports.filename
+        }
+        filename = f"soak_report_{self.stamp}.json"
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"📊 Soak Report: {filename}")
+        return report
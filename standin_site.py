@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Local Stand-in Site for LLM-BDD System
+A tiny saucedemo look-alike and an HTTP driver for benchmarks without Chrome
+
+Like saucedemo, the cart lives in the browser's storage: it survives logging
+out and in again until the driver clears its storage.
+"""
+import struct
+import threading
+import uuid
+import urllib.parse
+import urllib.request
+import zlib
+from html.parser import HTMLParser
+from http.cookiejar import CookieJar
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><title>Swag Labs</title></head>
+<body>
+  <form action="/login" method="post">
+    <input type="text" id="user-name" name="user-name" data-test="username" placeholder="Username">
+    <input type="password" id="password" name="password" data-test="password" placeholder="Password">
+    <input type="submit" id="login-button" data-test="login-button" value="Login">
+  </form>
+  {error}
+</body></html>"""
+
+INVENTORY_PAGE = """<!DOCTYPE html>
+<html><head><title>Swag Labs</title></head>
+<body>
+  <div class="shopping_cart_link">{badge}</div>
+  <div class="inventory_list">
+    <div class="inventory_item">
+      <div class="inventory_item_name">Sauce Labs Backpack</div>
+      <button id="add-to-cart-sauce-labs-backpack" data-test="add-to-cart-sauce-labs-backpack"
+              data-action="/cart/add">Add to cart</button>
+    </div>
+  </div>
+</body></html>"""
+
+USERS = {"standard_user", "problem_user", "performance_glitch_user"}
+
+class StandInSite:
+    """Serves the stand-in pages on a background thread"""
+
+    def __init__(self, port=0):
+        carts = {}
+
+        class Handler(BaseHTTPRequestHandler):
+            def _storage(self):
+                return self.headers.get("X-Storage-Id", "")
+
+            def _user(self):
+                for part in self.headers.get("Cookie", "").split(";"):
+                    name, _, value = part.strip().partition("=")
+                    if name == "session-username" and value in USERS:
+                        return value
+                return None
+
+            def _send(self, body, status=200, headers=()):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _redirect(self, location, headers=()):
+                self._send("", 302, [("Location", location)] + list(headers))
+
+            def do_GET(self):
+                path = urllib.parse.urlparse(self.path).path
+                if path == "/inventory.html":
+                    user = self._user()
+                    if not user:
+                        return self._redirect("/")
+                    count = carts.get(self._storage(), 0)
+                    badge = f'<span class="shopping_cart_badge">{count}</span>' if count else ""
+                    return self._send(INVENTORY_PAGE.format(badge=badge))
+                self._send(LOGIN_PAGE.format(error=""))
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                form = urllib.parse.parse_qs(self.rfile.read(length).decode("utf-8"))
+                if self.path == "/login":
+                    user = form.get("user-name", [""])[0]
+                    if user in USERS and form.get("password", [""])[0] == "secret_sauce":
+                        return self._redirect("/inventory.html",
+                                              [("Set-Cookie", f"session-username={user}; Path=/")])
+                    error = '<h3 data-test="error">Username and password do not match</h3>'
+                    return self._send(LOGIN_PAGE.format(error=error))
+                if self.path == "/cart/add" and self._user():
+                    carts[self._storage()] = carts.get(self._storage(), 0) + 1
+                    return self._redirect("/inventory.html")
+                self._redirect("/")
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+def _tiny_png(width=8, height=8, rgb=(255, 255, 255)):
+    """Solid-colour PNG bytes"""
+    def chunk(kind, data):
+        return (struct.pack(">I", len(data)) + kind + data
+                + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff))
+    row = b"\x00" + bytes(rgb) * width
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(row * height))
+            + chunk(b"IEND", b""))
+
+class _Page(HTMLParser):
+    """Collects elements with their attributes and text"""
+
+    def __init__(self):
+        super().__init__()
+        self.elements = []
+        self.open = []
+        self.title = ""
+        self.in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        element = StandInElement(None, tag, dict(attrs))
+        self.elements.append(element)
+        if tag == "title":
+            self.in_title = True
+        if tag not in ("input", "br", "img", "meta"):
+            self.open.append(element)
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self.in_title = False
+        if self.open and self.open[-1].tag == tag:
+            self.open.pop()
+
+    def handle_data(self, data):
+        if self.in_title:
+            self.title += data
+        elif self.open:
+            self.open[-1].text += data.strip()
+
+class StandInElement:
+    def __init__(self, driver, tag, attrs):
+        self.driver = driver
+        self.tag = tag
+        self.attrs = attrs
+        self.text = ""
+
+    def send_keys(self, value):
+        self.driver.form[self.attrs.get("name", self.attrs.get("id"))] = value
+
+    def click(self):
+        if self.attrs.get("type") == "submit":
+            self.driver._post("/login", self.driver.form)
+        elif "data-action" in self.attrs:
+            self.driver._post(self.attrs["data-action"], {})
+
+class StandInDriver:
+    """Minimal WebDriver look-alike that drives the stand-in site over HTTP"""
+
+    def __init__(self):
+        self.cookies = CookieJar()
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies))
+        self._new_storage()
+        self.current_url = ""
+        self.title = ""
+        self.form = {}
+        self.elements = []
+
+    def _load(self, response):
+        self.current_url = response.geturl()
+        page = _Page()
+        page.feed(response.read().decode("utf-8"))
+        for element in page.elements:
+            element.driver = self
+        self.elements = page.elements
+        self.title = page.title.strip()
+        self.form = {}
+
+    def _post(self, path, fields):
+        url = urllib.parse.urljoin(self.current_url, path)
+        data = urllib.parse.urlencode(fields).encode("utf-8")
+        with self.opener.open(url, data=data) as response:
+            self._load(response)
+
+    def get(self, url):
+        with self.opener.open(url) as response:
+            self._load(response)
+
+    def find_elements(self, by, value):
+        if by == "id":
+            return [e for e in self.elements if e.attrs.get("id") == value]
+        if by == "class name":
+            return [e for e in self.elements if value in e.attrs.get("class", "").split()]
+        if by == "css selector" and value.startswith('[data-test="'):
+            test_id = value[len('[data-test="'):-2]
+            return [e for e in self.elements if e.attrs.get("data-test") == test_id]
+        return []
+
+    def save_screenshot(self, filename):
+        with open(filename, 'wb') as f:
+            f.write(_tiny_png())
+        return True
+
+    def _new_storage(self):
+        """Stand-in for localStorage: the site keys the cart by this id"""
+        self.opener.addheaders = [("X-Storage-Id", uuid.uuid4().hex)]
+
+    def execute_script(self, script, *args):
+        if "localStorage.clear()" in script:
+            self._new_storage()
+        return None
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def quit(self):
+        self.elements = []
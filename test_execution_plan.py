@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Execution plan test for LLM-BDD System
+Runs scenarios from compiled (and reloaded) plans against the local stand-in site
+"""
+import os
+import tempfile
+import unittest
+
+from execution_plan import PlanCache, compile_plan
+from py313_tester import CompleteRealTester
+from standin_site import StandInSite, StandInDriver
+
+FEATURE = """Feature: Cart
+
+  @positive
+  Scenario: Login and add backpack
+    Given I am logged in
+    When I add "Sauce Labs Backpack" to cart
+    Then the cart should show 1 item
+
+  @positive
+  Scenario: Login with an unknown user
+    Given I am on the login page
+    When I enter "nobody" as username
+    And I enter "secret_sauce" as password
+    And I click the login button
+    Then I should be redirected to the products page"""
+
+COUNT_OUTLINE = """Feature: Cart counts
+
+  @positive
+  Scenario Outline: Cart shows <count>
+    Given I am logged in
+    When I add "Sauce Labs Backpack" to cart
+    Then the cart should show <count> item
+
+    Examples:
+      | count |
+      | 1     |
+      | 2     |"""
+
+class ExecutionPlanTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(tempfile.mkdtemp(prefix="plan_test_"))
+        self.site = StandInSite()
+        self.tester = CompleteRealTester()
+        self.tester.website_url = self.site.url
+        self.tester.driver_factory = StandInDriver
+        self.tester.wait_scale = 0
+        self.tester.generated_gherkin = FEATURE
+        scenarios = self.tester._parse_gherkin()
+        cache = PlanCache()
+        cache.save(compile_plan(FEATURE, scenarios, scenarios))
+        self.plan = cache.load(FEATURE)
+
+    def tearDown(self):
+        self.tester.cleanup()
+        self.site.stop()
+        os.chdir(self.cwd)
+
+    def test_steps_run_from_the_loaded_plan(self):
+        self.tester.plan = self.plan
+        self.tester._open_browser()
+        cart, unknown_user = self.plan['scenarios']
+
+        # Named "Login ..." but bound to the cart steps, which are what runs
+        self.assertEqual([b['action'] for b in cart['bindings']],
+                         ['login', 'add_to_cart', 'assert_cart_count'])
+        self.assertEqual(self.tester._execute_single_test(cart, 1)['status'], 'PASSED')
+
+        self.tester._reset_session()
+        self.assertEqual(self.tester._execute_single_test(unknown_user, 2)['status'], 'FAILED')
+
+    def test_outline_rows_bind_placeholder_steps(self):
+        self.tester.generated_gherkin = COUNT_OUTLINE
+        scenarios = self.tester._parse_gherkin()
+        outline = compile_plan(COUNT_OUTLINE, scenarios, scenarios)['scenarios'][0]
+        self.assertEqual(outline['bindings'][2]['action'], 'unbound')
+        self.tester._open_browser()
+
+        result = self.tester._run_scenario(outline, 1, self.tester._execute_single_test, "real_test")
+
+        # Row 2 expects 2 items but the fresh cart shows 1, so the check must run and fail
+        self.assertEqual(result['rows'], {"total": 2, "passed": 1, "failed": 1})
+        self.assertEqual(result['failed_rows'], [2])
+        self.assertEqual(result['rows_with_skipped_steps'], 0)
+
+    def test_unbound_steps_are_recorded(self):
+        self.tester._open_browser()
+        scenario = {'name': 'Checkout', 'steps': ['Given I am logged in', 'When I try to checkout']}
+
+        result = self.tester._execute_single_test(scenario, 3)
+
+        self.assertEqual(result['skipped_steps'], ['When I try to checkout'])
+
+    def test_scenarios_in_a_run_do_not_share_the_cart(self):
+        cart = self.plan['scenarios'][0]
+        self.tester.approved = [cart, dict(cart, name="Add backpack again")]
+        self.tester._open_browser()
+
+        results = self.tester._execute_approved()
+
+        self.assertEqual([r['status'] for r in results], ['PASSED', 'PASSED'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Outline execution test for LLM-BDD System
+Runs a multi-row Scenario Outline against the local stand-in site
+"""
+import os
+import tempfile
+import unittest
+
+from py313_tester import CompleteRealTester
+from standin_site import StandInSite, StandInDriver
+
+OUTLINE_GHERKIN = """Feature: Logins
+
+  @positive
+  Scenario Outline: Login as <username>
+    Given I am on the login page
+    When I enter "<username>" as username
+    And I enter "<password>" as password
+    And I click the login button
+    Then I should be redirected to the products page
+
+    Examples:
+      | username                | password     |
+      | standard_user           | secret_sauce |
+      | problem_user            | secret_sauce |
+      | performance_glitch_user | secret_sauce |"""
+
+CART_OUTLINE_GHERKIN = """Feature: Cart
+
+  @positive
+  Scenario Outline: Backpack in cart for <username>
+    Given I am logged in as "<username>"
+    When I add "Sauce Labs Backpack" to cart
+    Then the cart should show 1 item
+
+    Examples:
+      | username      |
+      | standard_user |
+      | standard_user |
+      | problem_user  |"""
+
+class OutlineExecutionTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(tempfile.mkdtemp(prefix="outline_test_"))
+        self.site = StandInSite()
+        self.tester = CompleteRealTester()
+        self.tester.website_url = self.site.url
+        self.tester.driver_factory = StandInDriver
+        self.tester.wait_scale = 0
+
+    def tearDown(self):
+        self.tester.cleanup()
+        self.site.stop()
+        os.chdir(self.cwd)
+
+    def test_every_row_starts_from_a_fresh_session(self):
+        self.tester.generated_gherkin = OUTLINE_GHERKIN
+        outline = self.tester._parse_gherkin()[0]
+        self.tester._open_browser()
+
+        result = self.tester._run_scenario(outline, 1, self.tester._execute_single_test, "real_test")
+
+        self.assertEqual(result['status'], 'PASSED')
+        self.assertIn('[3/3 rows passed]', result['name'])
+
+    def test_cart_does_not_carry_over_between_rows(self):
+        self.tester.generated_gherkin = CART_OUTLINE_GHERKIN
+        outline = self.tester._parse_gherkin()[0]
+        self.tester._open_browser()
+
+        result = self.tester._run_scenario(outline, 1, self.tester._execute_single_test, "real_test")
+
+        self.assertEqual(result['status'], 'PASSED')
+        self.assertIn('[3/3 rows passed]', result['name'])
+
+if __name__ == "__main__":
+    unittest.main()
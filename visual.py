@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Visual Baselines for LLM-BDD System
+Compares scenario screenshots with stored baselines (perceptual hash, then masked pixel diff)
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+BASELINE_DIR = "visual_baselines"
+HASH_FAIL_DISTANCE = 20
+PIXEL_TOLERANCE = 16
+MAX_DIFF_RATIO = 0.0001
+
+def baseline_key(name):
+    """File-safe key for a scenario name"""
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+def load_rgb(path):
+    """Decode a PNG into an HxWx3 uint8 array"""
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGB"))
+
+def perceptual_hash(pixels, size=8):
+    """dHash: sign of horizontal gradients on a (size x size+1) grayscale thumbnail"""
+    gray = pixels.astype(np.float64) @ np.array([0.299, 0.587, 0.114])
+    ys = np.linspace(0, gray.shape[0], size + 1).astype(int)
+    xs = np.linspace(0, gray.shape[1], size + 2).astype(int)
+    # Block means from an integral image
+    integral = np.pad(gray.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+    sums = (integral[ys[1:, None], xs[None, 1:]] - integral[ys[:-1, None], xs[None, 1:]]
+            - integral[ys[1:, None], xs[None, :-1]] + integral[ys[:-1, None], xs[None, :-1]])
+    thumb = sums / np.maximum(np.outer(np.diff(ys), np.diff(xs)), 1)
+    return (thumb[:, 1:] > thumb[:, :-1]).flatten()
+
+def _mask(shape, regions):
+    """Boolean mask of pixels to compare; regions are ignored [x, y, w, h] boxes"""
+    mask = np.ones(shape[:2], dtype=bool)
+    for x, y, w, h in regions:
+        mask[y:y + h, x:x + w] = False
+    return mask
+
+def _digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def compare(screenshot, baseline, regions=(), diff_path=None):
+    """Compare one screenshot with its baseline; returns a JSON-friendly result"""
+    if _digest(screenshot) == _digest(baseline):
+        return {"status": "MATCH", "check": "identical", "hash_distance": 0, "diff_ratio": 0.0}
+
+    actual, expected = load_rgb(screenshot), load_rgb(baseline)
+    distance = int(np.count_nonzero(perceptual_hash(actual) != perceptual_hash(expected)))
+    if distance > HASH_FAIL_DISTANCE:
+        return {"status": "MISMATCH", "check": "perceptual_hash",
+                "hash_distance": distance, "diff_ratio": None}
+    if actual.shape != expected.shape:
+        return {"status": "MISMATCH", "check": "size", "hash_distance": distance,
+                "diff_ratio": None, "size": [list(actual.shape[:2]), list(expected.shape[:2])]}
+
+    mask = _mask(actual.shape, regions)
+    changed = (np.abs(actual.astype(np.int16) - expected.astype(np.int16)).max(axis=2)
+               > PIXEL_TOLERANCE) & mask
+    ratio = float(changed.sum()) / max(int(mask.sum()), 1)
+    result = {"status": "MATCH" if ratio <= MAX_DIFF_RATIO else "MISMATCH",
+              "check": "pixel_diff", "hash_distance": distance, "diff_ratio": round(ratio, 6)}
+
+    if result["status"] == "MISMATCH" and diff_path:
+        gray = (expected.mean(axis=2, keepdims=True) * 0.4).astype(np.uint8).repeat(3, axis=2)
+        gray[changed] = (255, 0, 0)
+        Image.fromarray(gray).save(diff_path)
+        result["diff_image"] = diff_path
+    return result
+
+def _compare_job(job):
+    """Process-pool entry point"""
+    result_id, screenshot, baseline, regions, diff_path = job
+    try:
+        return result_id, compare(screenshot, baseline, regions, diff_path)
+    except Exception as e:
+        return result_id, {"status": "ERROR", "error": str(e)}
+
+def _regions(key, baseline_dir):
+    path = os.path.join(baseline_dir, f"{key}.mask.json")
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return []
+
+def _pool_context():
+    """Start workers without fork(): the caller may be one of several pipeline threads"""
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    # Workers only need this module, not the caller's __main__ preloaded into the server
+    context.set_forkserver_preload([])
+    return context
+
+def compare_run(results, diff_dir, baseline_dir=BASELINE_DIR, workers=None):
+    """Compare every screenshot of a run in a process pool; returns {result id: visual result}"""
+    jobs = []
+    outcome = {}
+    for result in results:
+        screenshot = result.get('screenshot')
+        if not screenshot or not os.path.exists(screenshot):
+            continue
+        key = baseline_key(result['name'])
+        baseline = os.path.join(baseline_dir, f"{key}.png")
+        if not os.path.exists(baseline):
+            outcome[result['id']] = {"status": "NO_BASELINE"}
+            continue
+        jobs.append((result['id'], screenshot, baseline, _regions(key, baseline_dir),
+                     os.path.join(diff_dir, f"{result['id']}_{key}.diff.png")))
+
+    if jobs:
+        os.makedirs(diff_dir, exist_ok=True)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+            for result_id, visual in pool.map(_compare_job, jobs):
+                outcome[result_id] = visual
+    return outcome
+
+def update_baselines(report_file, baseline_dir=BASELINE_DIR):
+    """Copy screenshots of passed scenarios in an approved run into the baselines"""
+    with open(report_file, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    os.makedirs(baseline_dir, exist_ok=True)
+    updated = []
+    for result in report.get('test_execution', {}).get('results', []):
+        screenshot = result.get('screenshot')
+        # A visual mismatch is what is being approved, so use the functional status
+        status = result.get('functional_status', result['status'])
+        if status != 'PASSED' or not screenshot or not os.path.exists(screenshot):
+            continue
+        target = os.path.join(baseline_dir, f"{baseline_key(result['name'])}.png")
+        shutil.copyfile(screenshot, target)
+        updated.append(target)
+    return updated
+
+def main():
+    parser = argparse.ArgumentParser(description="Visual baseline management")
+    parser.add_argument("--approve", metavar="REPORT", required=True,
+                        help="complete_report_*.json whose passed screenshots become baselines")
+    parser.add_argument("--baseline-dir", default=BASELINE_DIR)
+    args = parser.parse_args()
+
+    updated = update_baselines(args.approve, args.baseline_dir)
+    print(f"✅ Updated {len(updated)} baselines in {args.baseline_dir}")
+    for path in updated:
+        print(f"  • {path}")
+
+if __name__ == "__main__":
+    main()